@@ -1,18 +1,34 @@
 # Standard Imports
 import os
+import asyncio
+import contextvars
+import copy
 import stat
+import hashlib
+import pickle
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import numpy as np
+import h5py
 import warnings
-from bokeh.models import Tooltip
+from contextlib import contextmanager
+from functools import partial
 
+# platformdirs is optional; without it the event cache uses the XDG default location
+try:
+    from platformdirs import user_cache_dir
+except ImportError:
+    user_cache_dir = None
 
 # HoloViz Imports
 import panel as pn
 
-# Stingray Imports
-from stingray.events import EventList
-from stingray import Lightcurve
-from stingray.io import get_file_extension
+# Astropy Imports
+from astropy.table import Table
+from astropy.io.misc.hdf5 import read_table_hdf5, write_table_hdf5
+from astropy.io.misc import yaml as astropy_yaml
 
 # Dashboard Classes and Event Data Imports
 from utils.globals import loaded_event_data, loaded_light_curve
@@ -36,6 +52,97 @@ loaded_data_path = os.path.join(os.getcwd(), "files", "loaded-data")
 # Create the loaded-data directory if it doesn't exist
 os.makedirs(loaded_data_path, exist_ok=True)
 
+# File extensions that may be deleted from the dashboard
+DELETABLE_EXTENSIONS = (
+    ".pkl",
+    ".pickle",
+    ".fits",
+    ".evt",
+    ".h5",
+    ".hdf5",
+    ".npz",
+    ".ecsv",
+    ".txt",
+    ".dat",
+    ".csv",
+    ".vot",
+    ".tex",
+    ".html",
+    ".gz",
+)
+
+# Source and binary extensions that are never deleted, even through a symlink
+PROTECTED_EXTENSIONS = (".py", ".pyc", ".pyo", ".so", ".pyd", ".dll", ".exe")
+
+# Directory holding pickled EventList.read results, keyed on the source file; it lives
+# in the user cache directory so the pickles never show up among the loaded data
+if user_cache_dir is not None:
+    event_cache_path = os.path.join(user_cache_dir("StingrayExplorer"), "event-lists")
+else:
+    event_cache_path = os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "StingrayExplorer",
+        "event-lists",
+    )
+
+# Serializes evictions from the event cache
+_event_cache_prune_lock = threading.Lock()
+
+# Guards changes to `loaded_event_data` and the snapshots of it taken by operations
+# running in worker threads; held only around those short sections, never across I/O
+loaded_data_lock = threading.Lock()
+
+# Warning handler of the dashboard operation running in the current context. Worker
+# threads started with `asyncio.to_thread` get a copy of the context, so they see it too
+_active_warning_handler = contextvars.ContextVar("active_warning_handler", default=None)
+
+# `warnings.showwarning` hook that was installed before `_dispatch_warning`, used for
+# warnings raised outside any dashboard operation
+_fallback_showwarning = warnings.showwarning
+
+# EventLists already parsed in this process, keyed like the pickle cache, kept only
+# while some loaded name still references them
+parsed_event_lists = weakref.WeakValueDictionary()
+
+# Buffer size for reading and writing cached EventList pickles
+CACHE_BUFFER_BYTES = 1 << 20
+
+# Upper bound on the size of the EventList cache before old entries are evicted
+EVENT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+# Maximum number of files read concurrently when loading several event lists
+MAX_READ_WORKERS = 8
+
+# Name of the HDF5 file that holds every event list saved with the default format
+CONSOLIDATED_FILE_NAME = "loaded_events.h5"
+
+# EventList columns stored by consolidated HDF5 files written before the table layout
+EVENT_COLUMNS = ("time", "pi", "energy")
+
+# `layout` attribute of consolidated event list groups that hold a full astropy table
+TABLE_LAYOUT = "astropy-table"
+
+# Target size of each compressed chunk in the consolidated HDF5 file
+HDF5_CHUNK_BYTES = 1 << 20
+
+# Chunk cache settings used when writing the consolidated HDF5 file, sized to hold
+# many full chunks so each one is compressed once instead of being evicted part-written
+HDF5_CACHE_BYTES = 64 * 1024 * 1024
+HDF5_CACHE_SLOTS = 521
+HDF5_CACHE_W0 = 0.75
+
+# File space page size of a newly created consolidated HDF5 file, matching the chunk size
+HDF5_PAGE_BYTES = HDF5_CHUNK_BYTES
+
+# Preview text of each loaded event list, keyed by name
+event_list_previews = {}
+
+# Directories already created by `ensure_directory`
+_created_dirs = set()
+
+# Extensions stripped from a file name to derive its default event list name
+STRIPPED_NAME_EXTENSIONS = {".gz", ".bz2", ".fits", ".evt"}
+
 
 def create_warning_handler():
     """
@@ -56,6 +163,497 @@ def create_warning_handler():
     return warning_handler
 
 
+def ensure_directory(path):
+    """
+    Create a directory unless this process has already created it. An empty path,
+    as `os.path.dirname` returns for a bare file name, is the working directory
+    and is skipped.
+
+    Args:
+        path (str): The directory to create.
+    """
+    if path and path not in _created_dirs:
+        os.makedirs(path, exist_ok=True)
+        _created_dirs.add(path)
+
+
+def _event_cache_key(file_path, file_format, kwargs):
+    """
+    Build the cache key for a file from its resolved path, modification time,
+    size, format and reader keyword arguments.
+    """
+    file_stat = os.stat(file_path)
+    key = (
+        f"{os.path.realpath(file_path)}|{file_stat.st_mtime_ns}|{file_stat.st_size}|"
+        f"{file_format}|{sorted(kwargs.items())}"
+    )
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def prune_event_cache(max_bytes=EVENT_CACHE_MAX_BYTES):
+    """
+    Evict the least recently used cached EventLists until the cache fits in `max_bytes`.
+
+    Args:
+        max_bytes (int): The maximum total size of the cache directory.
+    """
+    with _event_cache_prune_lock:
+        entries = []
+        try:
+            scanned = list(os.scandir(event_cache_path))
+        except OSError:
+            return
+        for entry in scanned:
+            if entry.name.endswith(".pkl"):
+                try:
+                    entry_stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry_stat.st_mtime, entry_stat.st_size, entry.path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+
+def read_cached_event_list(file_path, file_format, **kwargs):
+    """
+    Read an EventList, copying the one still held in memory or reusing a pickled copy
+    when the file has not changed since it was last read.
+
+    Args:
+        file_path (str): The path of the file to read.
+        file_format (str): The format passed to `EventList.read`.
+        **kwargs: Further keyword arguments passed to `EventList.read`.
+
+    Returns:
+        EventList: The loaded event list.
+
+    Restrictions:
+        - Reads that pass an `rmf_file` are not cached, as the RMF content is not part of the key.
+        - A file loaded again while its earlier copy is still loaded returns a deep copy of
+          it, skipping the parse but never sharing arrays between loaded names.
+        - Old entries are not evicted here; call `prune_event_cache` after a batch of reads.
+
+    Example:
+        >>> event_list = read_cached_event_list("files/data/monol_testA.evt", "ogip")
+    """
+    from stingray.events import EventList
+
+    if kwargs.get("rmf_file") is not None:
+        return EventList.read(file_path, fmt=file_format, **kwargs)
+
+    cache_key = _event_cache_key(file_path, file_format, kwargs)
+    event_list = parsed_event_lists.get(cache_key)
+    if event_list is not None:
+        # Each loaded name gets its own copy, so changing one does not change the other
+        return copy.deepcopy(event_list)
+
+    cache_file = os.path.join(event_cache_path, f"{cache_key}.pkl")
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, "rb", buffering=CACHE_BUFFER_BYTES) as f:
+                event_list = pickle.load(f)
+            # Refresh the entry so eviction treats it as recently used
+            os.utime(cache_file)
+            parsed_event_lists[cache_key] = event_list
+            return event_list
+        except Exception:
+            # Unreadable entries, including pickles from other stingray or numpy
+            # versions, are dropped and the file is read again
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+
+    event_list = EventList.read(file_path, fmt=file_format, **kwargs)
+    parsed_event_lists[cache_key] = event_list
+
+    temp_file = None
+    try:
+        ensure_directory(event_cache_path)
+        # A unique temporary file per write, as several threads may cache the same file
+        with tempfile.NamedTemporaryFile(
+            "wb",
+            buffering=CACHE_BUFFER_BYTES,
+            dir=event_cache_path,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            temp_file = f.name
+            pickle.dump(event_list, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_file, cache_file)
+    except (OSError, pickle.PicklingError) as e:
+        if temp_file is not None and os.path.exists(temp_file):
+            os.remove(temp_file)
+        # The directory may have been removed; create it again on the next write
+        _created_dirs.discard(event_cache_path)
+        warnings.warn(f"Could not cache '{file_path}': {e}", RuntimeWarning)
+
+    return event_list
+
+
+def read_memmapped_event_list(file_path):
+    """
+    Read a FITS table as an EventList whose columns are memory-mapped from the file.
+
+    These reads bypass the pickle cache, which would load every column into memory.
+
+    Args:
+        file_path (str): The path of the FITS file to read.
+
+    Returns:
+        EventList: The loaded event list.
+    """
+    from stingray.events import EventList
+
+    table = Table.read(file_path, format="fits", memmap=True)
+    return EventList.from_astropy_table(table)
+
+
+def read_event_file(file_path, file_format, rmf_file=None, additional_columns=None):
+    """
+    Read a single event file, passing the RMF file only to formats that accept it on read.
+
+    Args:
+        file_path (str): The path of the file to read.
+        file_format (str): The format passed to `EventList.read`.
+        rmf_file: The RMF file for energy calibration, if any.
+        additional_columns (list): Additional columns to read, if any.
+
+    Returns:
+        EventList: The loaded event list.
+    """
+    if file_format == "npz":
+        return read_npz_event_list(file_path)
+    # Plain FITS tables are memory-mapped, so columns are paged in on access
+    if file_format == "fits" and rmf_file is None and additional_columns is None:
+        return read_memmapped_event_list(file_path)
+    # Handle rmf_file separately for 'hea' or 'ogip' formats
+    if file_format in ("hea", "ogip"):
+        return read_cached_event_list(
+            file_path, file_format, additional_columns=additional_columns
+        )
+    # Directly pass rmf_file content for other formats
+    return read_cached_event_list(
+        file_path,
+        file_format,
+        rmf_file=rmf_file,
+        additional_columns=additional_columns,
+    )
+
+
+def _hdf5_chunk_options(shape, itemsize):
+    """
+    Return the `create_dataset` keyword arguments for LZF-compressed chunks that hold
+    about `HDF5_CHUNK_BYTES` of data along the first axis.
+
+    Empty datasets are stored contiguously and uncompressed, as h5py rejects chunks
+    larger than the data.
+    """
+    if shape[0] == 0:
+        return {}
+    row_bytes = max(1, itemsize * int(np.prod(shape[1:])))
+    chunk_rows = max(1, min(shape[0], HDF5_CHUNK_BYTES // row_bytes))
+    return {"chunks": (chunk_rows,) + tuple(shape[1:]), "compression": "lzf"}
+
+
+def _create_compressed_dataset(group, name, values):
+    """
+    Create an LZF-compressed dataset whose chunks along the first axis hold about
+    `HDF5_CHUNK_BYTES` of data.
+    """
+    values = np.asarray(values)
+    return group.create_dataset(
+        name, data=values, **_hdf5_chunk_options(values.shape, values.itemsize)
+    )
+
+
+def write_npz_event_list(save_path, event_list):
+    """
+    Write an event list to a new compressed `.npz` file.
+
+    Every column of the event list's astropy table is stored as an array, and the
+    remaining attributes as YAML under `__meta__`. The GTIs and MJDREF are also kept
+    under `gti` and `mjdref`, as in earlier files.
+
+    Args:
+        save_path (str): The path of the `.npz` file.
+        event_list (EventList): The event list to write.
+
+    Exceptions:
+        - Raises FileExistsError if `save_path` already exists.
+    """
+    table = event_list.to_astropy_table()
+    arrays = {column: np.asarray(table[column]) for column in table.colnames}
+    if event_list.gti is not None:
+        arrays["gti"] = np.asarray(event_list.gti)
+    with open(save_path, "xb") as f:
+        np.savez_compressed(
+            f,
+            __meta__=np.array(astropy_yaml.dump(dict(table.meta))),
+            mjdref=event_list.mjdref,
+            **arrays,
+        )
+
+
+def read_npz_event_list(file_path):
+    """
+    Read an event list written by `write_npz_event_list`.
+
+    Args:
+        file_path (str): The path of the `.npz` file.
+
+    Returns:
+        EventList: The loaded event list.
+    """
+    from stingray.events import EventList
+
+    with np.load(file_path) as npz_file:
+        if "__meta__" in npz_file:
+            meta = astropy_yaml.load(str(npz_file["__meta__"]))
+            columns = [
+                key
+                for key in npz_file.files
+                if key not in ("__meta__", "gti", "mjdref")
+            ]
+            event_list = EventList.from_astropy_table(
+                Table({column: npz_file[column] for column in columns}, meta=meta)
+            )
+            # Tables without rows carry no metadata, so restore these explicitly
+            if "gti" in npz_file:
+                event_list.gti = npz_file["gti"]
+            event_list.mjdref = float(npz_file["mjdref"])
+            return event_list
+
+        # Files written before the metadata was stored hold only these columns
+        columns = {
+            column: npz_file[column] for column in EVENT_COLUMNS if column in npz_file
+        }
+        return EventList(
+            gti=npz_file["gti"] if "gti" in npz_file else None,
+            mjdref=float(npz_file["mjdref"]),
+            **columns,
+        )
+
+
+def _open_consolidated_file(save_path):
+    """
+    Open the consolidated HDF5 file for writing, creating it with paged file space if
+    it does not exist yet.
+
+    h5py only accepts a file space strategy when it creates a file, so an existing
+    file is opened for appending without one.
+    """
+    cache_options = {
+        "rdcc_nbytes": HDF5_CACHE_BYTES,
+        "rdcc_nslots": HDF5_CACHE_SLOTS,
+        "rdcc_w0": HDF5_CACHE_W0,
+    }
+    if os.path.exists(save_path):
+        return h5py.File(save_path, "a", libver="latest", **cache_options)
+    return h5py.File(
+        save_path,
+        "x",
+        libver="latest",
+        fs_strategy="page",
+        fs_page_size=HDF5_PAGE_BYTES,
+        **cache_options,
+    )
+
+
+def write_consolidated_event_lists(save_path, named_event_lists):
+    """
+    Write several event lists as groups of a single HDF5 file.
+
+    Each event list is stored under `/events/<name>` as its astropy table: one chunked,
+    LZF-compressed `events` dataset holding every column, including additional ones
+    such as `detector_id`, with the remaining attributes (dt, mission, instr, header,
+    timeref, timesys, ephem, notes, ...) serialized alongside. The GTIs and MJDREF are
+    also kept as a `gti` dataset and group attribute, as in earlier layouts. The file is
+    opened only once.
+    The file uses the latest HDF5 format, whose compact group and chunk indexes are
+    faster to write and look up.
+
+    Args:
+        save_path (str): The path of the consolidated HDF5 file.
+        named_event_lists (list): (name, EventList) pairs to write.
+
+    Exceptions:
+        - Raises FileExistsError if a name is already stored in the file.
+    """
+    with _open_consolidated_file(save_path) as h5_file:
+        events_group = h5_file.require_group("events")
+        for name, _ in named_event_lists:
+            if name in events_group:
+                raise FileExistsError(
+                    f"A file with the name '{name}' already exists. Please provide a different name."
+                )
+
+        for name, event_list in named_event_lists:
+            group = events_group.create_group(name)
+            table = event_list.to_astropy_table()
+            write_table_hdf5(
+                table,
+                group,
+                path="events",
+                serialize_meta=True,
+                **_hdf5_chunk_options((len(table),), table.dtype.itemsize),
+            )
+            group.attrs["layout"] = TABLE_LAYOUT
+            if event_list.gti is not None:
+                _create_compressed_dataset(group, "gti", event_list.gti)
+            group.attrs["mjdref"] = event_list.mjdref
+
+
+def is_consolidated_event_file(file_path):
+    """
+    Check whether a file was written by `write_consolidated_event_lists`.
+
+    Args:
+        file_path (str): The path of the file to check.
+
+    Returns:
+        bool: True if the file is an HDF5 file with an `events` group.
+    """
+    if not h5py.is_hdf5(file_path):
+        return False
+    with h5py.File(file_path, "r") as h5_file:
+        return "events" in h5_file
+
+
+def read_consolidated_event_lists(file_path):
+    """
+    Read every event list stored in a consolidated HDF5 file.
+
+    Args:
+        file_path (str): The path of the consolidated HDF5 file.
+
+    Returns:
+        list: (name, EventList) pairs in the order they are stored.
+    """
+    from stingray.events import EventList
+
+    named_event_lists = []
+    with h5py.File(file_path, "r") as h5_file:
+        for name, group in h5_file["events"].items():
+            if group.attrs.get("layout") == TABLE_LAYOUT:
+                event_list = EventList.from_astropy_table(
+                    read_table_hdf5(group, path="events")
+                )
+                # Tables without rows carry no metadata, so restore these explicitly
+                if "gti" in group:
+                    event_list.gti = group["gti"][()]
+                event_list.mjdref = group.attrs.get("mjdref", event_list.mjdref)
+                named_event_lists.append((name, event_list))
+                continue
+            if "events" in group:
+                # Files written before the table layout store structured records
+                records = group["events"][()]
+                columns = {
+                    column: np.ascontiguousarray(records[column])
+                    for column in records.dtype.names
+                }
+            else:
+                # Files written before the records layout store one dataset per column
+                columns = {
+                    column: group[column][()]
+                    for column in EVENT_COLUMNS
+                    if column in group
+                }
+            event_list = EventList(
+                gti=group["gti"][()] if "gti" in group else None,
+                mjdref=group.attrs.get("mjdref", 0),
+                **columns,
+            )
+            named_event_lists.append((name, event_list))
+    return named_event_lists
+
+
+def read_named_event_lists(
+    file_path, file_name, file_format, rmf_file=None, additional_columns=None
+):
+    """
+    Read the event lists contained in a file along with the names to store them under.
+
+    Consolidated HDF5 files restore every event list they contain under its saved
+    name; any other file yields a single event list named `file_name`.
+
+    Returns:
+        list: (name, EventList) pairs.
+    """
+    if file_format == "hdf5" and is_consolidated_event_file(file_path):
+        return read_consolidated_event_lists(file_path)
+    return [
+        (
+            file_name,
+            read_event_file(file_path, file_format, rmf_file, additional_columns),
+        )
+    ]
+
+
+def default_event_list_name(file_path):
+    """
+    Derive the default event list name of a file from its base name, stripping
+    compression and event file extensions.
+
+    Example:
+        >>> default_event_list_name("/data/ni1200120106.evt.gz")
+        'ni1200120106'
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    while os.path.splitext(stem)[1].lower() in STRIPPED_NAME_EXTENSIONS:
+        stem = os.path.splitext(stem)[0]
+    return stem
+
+
+def _dispatch_warning(message, category, filename, lineno, file=None, line=None):
+    """
+    `warnings.showwarning` hook that passes each warning to the handler of the
+    operation it was raised in, or to the previous hook outside any operation.
+    """
+    warning_handler = _active_warning_handler.get()
+    if warning_handler is None:
+        _fallback_showwarning(message, category, filename, lineno, file, line)
+    else:
+        warning_handler.warn(message, category, filename, lineno, file, line)
+
+
+@contextmanager
+def capture_warnings(warning_handler):
+    """
+    Route warnings raised inside the block to `warning_handler`, including those
+    raised in worker threads started with `asyncio.to_thread` within it.
+
+    The handler is kept in a context variable rather than swapped into
+    `warnings.showwarning`, so concurrent operations of other sessions and tabs keep
+    their own handlers and the block may contain an `await`. The process-wide hook
+    is only ever set to `_dispatch_warning`, and only from the calling thread.
+
+    Args:
+        warning_handler (WarningHandler): The handler for warnings.
+
+    Example:
+        >>> with capture_warnings(warning_handler):
+        ...     warnings.warn("Test warning")
+    """
+    global _fallback_showwarning
+    if warnings.showwarning is not _dispatch_warning:
+        _fallback_showwarning = warnings.showwarning
+        warnings.showwarning = _dispatch_warning
+    token = _active_warning_handler.set(warning_handler)
+    try:
+        yield
+    finally:
+        _active_warning_handler.reset(token)
+
+
 """ Header Section """
 
 
@@ -134,6 +732,20 @@ def create_loadingdata_warning_box(content):
     return WarningBox(warning_content=content)
 
 
+def show_read_progress(output_box_container, done_count, total):
+    """
+    Show how many of the selected files have been read so far.
+
+    Args:
+        output_box_container (OutputBox): The container for output messages.
+        done_count (int): The number of files read.
+        total (int): The number of files being read.
+    """
+    output_box_container[:] = [
+        create_loadingdata_output_box(f"Read {done_count} of {total} file(s)...")
+    ]
+
+
 def read_event_data(
     event,
     file_selector,
@@ -147,7 +759,8 @@ def read_event_data(
     warning_handler,
 ):
     """
-    Load event data from selected files.
+    Load event data from selected files with extended EventList.read functionality,
+    supporting FileDropper for RMF files and additional columns.
 
     Args:
         event: The event object triggering the function.
@@ -155,12 +768,14 @@ def read_event_data(
         filename_input (TextInput): The input widget for filenames.
         format_input (TextInput): The input widget for formats.
         format_checkbox (Checkbox): The checkbox for default format.
+        rmf_file_dropper (FileDropper): The file dropper for an optional RMF file.
+        additional_columns_input (TextInput): The input widget for additional columns.
         output_box_container (OutputBox): The container for output messages.
         warning_box_container (WarningBox): The container for warning messages.
         warning_handler (WarningHandler): The handler for warnings.
 
     Side effects:
-        - Modifies the global `loaded_event_data` list.
+        - Adds the loaded event lists to the global `loaded_event_data` dict.
         - Updates the output and warning containers with messages.
 
     Exceptions:
@@ -174,6 +789,7 @@ def read_event_data(
         >>> len(loaded_event_data)
         1  # Assuming one file was loaded
     """
+    # Validation for required inputs
     if not file_selector.value:
         output_box_container[:] = [
             create_loadingdata_output_box(
@@ -197,12 +813,11 @@ def read_event_data(
     if format_checkbox.value:
         formats = ["ogip" for _ in range(len(file_paths))]
 
+    # Files past the entered names get a default name derived from their path
+    named_count = len(filenames)
     if len(filenames) < len(file_paths):
         filenames.extend(
-            [
-                os.path.basename(path).split(".")[0]
-                for path in file_paths[len(filenames) :]
-            ]
+            [default_event_list_name(path) for path in file_paths[len(filenames) :]]
         )
     if len(formats) < len(file_paths):
         output_box_container[:] = [
@@ -212,50 +827,8 @@ def read_event_data(
         ]
         return
 
-
-def read_event_data(
-    event,
-    file_selector,
-    filename_input,
-    format_input,
-    format_checkbox,
-    rmf_file_dropper,
-    additional_columns_input,
-    output_box_container,
-    warning_box_container,
-    warning_handler,
-):
-    """
-    Load event data from selected files with extended EventList.read functionality,
-    supporting FileDropper for RMF files and additional columns.
-    """
-    # Validation for required inputs
-    if not file_selector.value:
-        output_box_container[:] = [
-            create_loadingdata_output_box(
-                "No file selected. Please select a file to upload."
-            )
-        ]
-        return
-
-    file_paths = file_selector.value
-    filenames = (
-        [name.strip() for name in filename_input.value.split(",")]
-        if filename_input.value
-        else []
-    )
-    formats = (
-        [fmt.strip() for fmt in format_input.value.split(",")]
-        if format_input.value
-        else []
-    )
-
-    if format_checkbox.value:
-        formats = ["ogip" for _ in range(len(file_paths))]
-
     # Retrieve the RMF file from FileDropper (if any)
-    if rmf_file_dropper.value:
-        rmf_file = rmf_file_dropper.value
+    rmf_file = rmf_file_dropper.value if rmf_file_dropper.value else None
 
     # Parse additional columns
     additional_columns = (
@@ -264,39 +837,94 @@ def read_event_data(
         else None
     )
 
+    # Consolidated HDF5 files restore their event lists under the names they were
+    # saved with, so a name entered for one would be silently ignored
+    consolidated = [
+        file_format == "hdf5" and is_consolidated_event_file(file_path)
+        for file_path, file_format in zip(file_paths, formats)
+    ]
+    for file_path, is_consolidated in zip(file_paths[:named_count], consolidated):
+        if is_consolidated:
+            output_box_container[:] = [
+                create_loadingdata_output_box(
+                    f"'{file_path}' holds event lists saved together, which are loaded under their saved names. Please do not enter a name for it."
+                )
+            ]
+            return
+
+    pending_names = set(loaded_event_data)
+    for file_name, is_consolidated in zip(filenames[: len(file_paths)], consolidated):
+        if is_consolidated:
+            continue
+        if file_name in pending_names:
+            output_box_container[:] = [
+                create_loadingdata_output_box(
+                    f"A file with the name '{file_name}' already exists in memory. Please provide a different name."
+                )
+            ]
+            return
+        pending_names.add(file_name)
+
     try:
         loaded_files = []
-        for file_path, file_name, file_format in zip(file_paths, filenames, formats):
-            if any(file_name == event[0] for event in loaded_event_data):
-                output_box_container[:] = [
-                    create_loadingdata_output_box(
-                        f"A file with the name '{file_name}' already exists in memory. Please provide a different name."
+        jobs = list(zip(file_paths, filenames, formats))
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(jobs))) as executor:
+            futures = [
+                # Each read runs in a copy of this context, so its warnings reach
+                # the handler of this operation
+                executor.submit(
+                    contextvars.copy_context().run,
+                    read_named_event_lists,
+                    file_path,
+                    file_name,
+                    file_format,
+                    rmf_file,
+                    additional_columns,
+                )
+                for file_path, file_name, file_format in jobs
+            ]
+            for done_count, _ in enumerate(as_completed(futures), start=1):
+                # Applied by the session's event loop rather than from this thread
+                pn.state.execute(
+                    partial(
+                        show_read_progress, output_box_container, done_count, len(jobs)
                     )
-                ]
-                return
-            # Handle rmf_file separately for 'hea' or 'ogip' formats
-            if file_format in ("hea", "ogip"):
-                event_list = EventList.read(
-                    file_path, fmt=file_format, additional_columns=additional_columns
                 )
-            else:
-                # Directly pass rmf_file content for other formats
-                event_list = EventList.read(
-                    file_path,
-                    fmt=file_format,
-                    rmf_file=rmf_file,
-                    additional_columns=additional_columns,
+            results = [future.result() for future in futures]
+        # Evict old cache entries once for the whole batch
+        prune_event_cache()
+
+        with loaded_data_lock:
+            # Consolidated files bring their own names, and other operations may have
+            # added names during the reads, so check them again before publishing
+            existing_names = set(loaded_event_data)
+            for named in results:
+                for name, _ in named:
+                    if name in existing_names:
+                        output_box_container[:] = [
+                            create_loadingdata_output_box(
+                                f"A file with the name '{name}' already exists in memory. Please provide a different name."
+                            )
+                        ]
+                        return
+                    existing_names.add(name)
+
+            # Only publish the event lists once every file has been read
+            for named in results:
+                loaded_event_data.update(named)
+
+        for (file_path, _, file_format), named in zip(jobs, results):
+            for file_name, event_list in named:
+                get_event_list_preview(file_name, event_list)
+                loaded_files.append(
+                    f"File '{file_path}' loaded successfully as '{file_name}' with format '{file_format}'."
                 )
-            loaded_event_data.append((file_name, event_list))
-            loaded_files.append(
-                f"File '{file_path}' loaded successfully as '{file_name}' with format '{file_format}'."
-            )
         output_box_container[:] = [
             create_loadingdata_output_box("\n".join(loaded_files))
         ]
         if warning_handler.warnings:
             warning_box_container[:] = [
-                create_loadingdata_warning_box("\n".join(warning_handler.warnings))
+                create_loadingdata_warning_box(warning_handler.format_all())
             ]
         else:
             warning_box_container[:] = [create_loadingdata_warning_box("No warnings.")]
@@ -332,6 +960,8 @@ def save_loaded_files(
 
     Side effects:
         - Saves files to disk in the specified formats.
+        - With the default format, saves all event lists into a single consolidated HDF5 file.
+        - Event lists saved with the "npz" format are written by `write_npz_event_list`.
         - Updates the output and warning containers with messages.
 
     Exceptions:
@@ -345,7 +975,11 @@ def save_loaded_files(
         >>> os.path.exists('/path/to/saved/file.hdf5')
         True  # Assuming the file was saved successfully
     """
-    if not loaded_event_data:
+    # Save a snapshot, so event lists loaded or cleared meanwhile do not affect this save
+    with loaded_data_lock:
+        event_lists = dict(loaded_event_data)
+
+    if not event_lists:
         output_box_container[:] = [
             create_loadingdata_output_box("No files loaded to save.")
         ]
@@ -354,7 +988,7 @@ def save_loaded_files(
     filenames = (
         [name.strip() for name in filename_input.value.split(",")]
         if filename_input.value
-        else [event[0] for event in loaded_event_data]
+        else list(event_lists)
     )
     formats = (
         [fmt.strip() for fmt in format_input.value.split(",")]
@@ -363,21 +997,21 @@ def save_loaded_files(
     )
 
     if format_checkbox.value:
-        formats = ["hdf5" for _ in range(len(loaded_event_data))]
+        formats = ["hdf5" for _ in range(len(event_lists))]
 
-    if len(filenames) < len(loaded_event_data):
+    if len(filenames) < len(event_lists):
         output_box_container[:] = [
             create_loadingdata_output_box("Please specify names for all loaded files.")
         ]
         return
-    if len(filenames) != len(loaded_event_data):
+    if len(filenames) != len(event_lists):
         output_box_container[:] = [
             create_loadingdata_output_box(
                 "Please ensure that the number of names matches the number of loaded files."
             )
         ]
         return
-    if len(formats) < len(loaded_event_data):
+    if len(formats) < len(event_lists):
         output_box_container[:] = [
             create_loadingdata_output_box(
                 "Please specify formats for all loaded files or check the default format option."
@@ -387,41 +1021,73 @@ def save_loaded_files(
 
     saved_files = []
     try:
-        for (loaded_name, event_list), file_name, file_format in zip(
-            loaded_event_data, filenames, formats
-        ):
-            if os.path.exists(
-                os.path.join(loaded_data_path, f"{file_name}.{file_format}")
+        if format_checkbox.value:
+            # Write every loaded event list into one consolidated HDF5 file
+            save_path = os.path.join(loaded_data_path, CONSOLIDATED_FILE_NAME)
+            named_event_lists = [
+                (file_name, event_list)
+                for event_list, file_name in zip(event_lists.values(), filenames)
+            ]
+            try:
+                write_consolidated_event_lists(save_path, named_event_lists)
+            except FileExistsError as e:
+                output_box_container[:] = [create_loadingdata_output_box(str(e))]
+                return
+            saved_files.extend(
+                f"File '{file_name}' saved successfully to '{save_path}'."
+                for file_name, _ in named_event_lists
+            )
+        else:
+            # List the directory afresh for each save instead of a stat per file
+            existing_files = set(os.listdir(loaded_data_path))
+            for (loaded_name, event_list), file_name, file_format in zip(
+                event_lists.items(), filenames, formats
             ):
-                output_box_container[:] = [
-                    create_loadingdata_output_box(
-                        f"A file with the name '{file_name}' already exists. Please provide a different name."
+                save_name = f"{file_name}.{file_format}"
+                save_path = os.path.join(loaded_data_path, save_name)
+                if save_name in existing_files:
+                    output_box_container[:] = [
+                        create_loadingdata_output_box(
+                            f"A file with the name '{file_name}' already exists. Please provide a different name."
+                        )
+                    ]
+                    return
+
+                if file_format == "npz":
+                    write_npz_event_list(save_path, event_list)
+                elif file_format == "hdf5":
+                    # Byte-shuffled LZF chunks compress float and integer columns well
+                    # and are still read transparently by EventList.read
+                    table = event_list.to_astropy_table()
+                    table.write(
+                        save_path,
+                        format=file_format,
+                        path="data",
+                        shuffle=len(table) > 0,
+                        **_hdf5_chunk_options((len(table),), table.dtype.itemsize),
                     )
-                ]
-                return
+                else:
+                    event_list.write(save_path, file_format)
 
-            save_path = os.path.join(loaded_data_path, f"{file_name}.{file_format}")
-            if file_format == "hdf5":
-                event_list.to_astropy_table().write(
-                    save_path, format=file_format, path="data"
+                existing_files.add(save_name)
+                saved_files.append(
+                    f"File '{file_name}' saved successfully to '{save_path}'."
                 )
-            else:
-                event_list.write(save_path, file_format)
-
-            saved_files.append(
-                f"File '{file_name}' saved successfully to '{save_path}'."
-            )
 
         output_box_container[:] = [
             create_loadingdata_output_box("\n".join(saved_files))
         ]
         if warning_handler.warnings:
             warning_box_container[:] = [
-                create_loadingdata_warning_box("\n".join(warning_handler.warnings))
+                create_loadingdata_warning_box(warning_handler.format_all())
             ]
         else:
             warning_box_container[:] = [create_loadingdata_warning_box("No warnings.")]
     except Exception as e:
+        if saved_files:
+            output_box_container[:] = [
+                create_loadingdata_output_box("\n".join(saved_files))
+            ]
         warning_box_container[:] = [
             create_loadingdata_warning_box(f"An error occurred while saving files: {e}")
         ]
@@ -455,7 +1121,8 @@ def delete_selected_files(
         - Displays exceptions in the warning box if file deletion fails.
 
     Restrictions:
-        - Cannot delete `.py` files for safety reasons.
+        - Only files with an extension in `DELETABLE_EXTENSIONS` can be deleted.
+        - Files resolving to a source or binary file (`PROTECTED_EXTENSIONS`) are never deleted.
 
     Example:
         >>> delete_selected_files(event, file_selector, warning_box_container, output_box_container, warning_handler)
@@ -463,23 +1130,6 @@ def delete_selected_files(
         False  # Assuming the file was deleted successfully
     """
 
-    # Define allowed extensions for deletion
-    allowed_extensions = {
-        ".pkl",
-        ".pickle",
-        ".fits",
-        ".evt",
-        ".h5",
-        ".hdf5",
-        ".ecsv",
-        ".txt",
-        ".dat",
-        ".csv",
-        ".vot",
-        ".tex",
-        ".html",
-        ".gz",
-    }
     if not file_selector.value:
         output_box_container[:] = [
             create_loadingdata_output_box(
@@ -488,26 +1138,32 @@ def delete_selected_files(
         ]
         return
 
-    file_paths = file_selector.value
+    # Visit files directory by directory to keep directory lookups cache-warm
+    file_paths = sorted(file_selector.value, key=os.path.dirname)
     deleted_files = []
     for file_path in file_paths:
-        if not any(file_path.endswith(ext) for ext in allowed_extensions):
+        if not file_path.endswith(DELETABLE_EXTENSIONS) or os.path.realpath(
+            file_path
+        ).endswith(PROTECTED_EXTENSIONS):
             deleted_files.append(
                 f"Cannot delete file '{file_path}': File type is not allowed for deletion."
             )
             continue
 
         try:
-            # Change the file permissions to ensure it can be deleted
-            os.chmod(file_path, stat.S_IWUSR | stat.S_IREAD | stat.S_IWRITE)
-            os.remove(file_path)
+            try:
+                os.remove(file_path)
+            except PermissionError:
+                # Change the file permissions to ensure it can be deleted
+                os.chmod(file_path, stat.S_IWUSR | stat.S_IREAD | stat.S_IWRITE)
+                os.remove(file_path)
             deleted_files.append(f"File '{file_path}' deleted successfully.")
         except Exception as e:
             deleted_files.append(f"An error occurred while deleting '{file_path}': {e}")
     output_box_container[:] = [create_loadingdata_output_box("\n".join(deleted_files))]
     if warning_handler.warnings:
         warning_box_container[:] = [
-            create_loadingdata_warning_box("\n".join(warning_handler.warnings))
+            create_loadingdata_warning_box(warning_handler.format_all())
         ]
     else:
         warning_box_container[:] = [create_loadingdata_warning_box("No warnings.")]
@@ -515,6 +1171,43 @@ def delete_selected_files(
     warning_handler.warnings.clear()
 
 
+def get_event_list_preview(file_name, event_list, time_limit=10):
+    """
+    Return the preview text of an event list, formatting it only the first time it is requested.
+
+    Args:
+        file_name (str): The name the event list is stored under.
+        event_list (EventList): The event list to preview.
+        time_limit (int): The number of time entries to preview.
+
+    Returns:
+        str: The preview text for the event list.
+    """
+    cached = event_list_previews.get(file_name)
+    if cached is not None and cached[0] is event_list and cached[1] == time_limit:
+        return cached[2]
+
+    # Bound the array representations so long GTI tables do not
+    # stringify every interval on each preview
+    with np.printoptions(threshold=8, edgeitems=2, linewidth=120):
+        time_data = f"Times (first {time_limit}): {event_list.time[:time_limit]}"
+        mjdref = f"MJDREF: {event_list.mjdref}"
+        gti = f"GTI: {np.asarray(event_list.gti)}"
+        pi_data = (
+            f"PI (first {time_limit}): {event_list.pi[:time_limit]}"
+            if event_list.pi is not None
+            else "PI: Not available"
+        )
+        energy_data = (
+            f"Energy (first {time_limit}): {event_list.energy[:time_limit]}"
+            if event_list.energy is not None
+            else "Energy: Not available"
+        )
+    preview = f"Event List - {file_name}:\n{time_data}\n{mjdref}\n{gti}\n{pi_data}\n{energy_data}\n"
+    event_list_previews[file_name] = (event_list, time_limit, preview)
+    return preview
+
+
 def preview_loaded_files(
     event,
     output_box_container,
@@ -547,27 +1240,15 @@ def preview_loaded_files(
     """
     preview_data = []
 
+    with loaded_data_lock:
+        event_lists = list(loaded_event_data.items())
+
     # Preview EventList data
-    if loaded_event_data:
-        for file_name, event_list in loaded_event_data:
+    if event_lists:
+        for file_name, event_list in event_lists:
             try:
-                time_data = (
-                    f"Times (first {time_limit}): {event_list.time[:time_limit]}"
-                )
-                mjdref = f"MJDREF: {event_list.mjdref}"
-                gti = f"GTI: {event_list.gti}"
-                pi_data = (
-                    f"PI (first {time_limit}): {event_list.pi[:time_limit]}"
-                    if event_list.pi is not None
-                    else "PI: Not available"
-                )
-                energy_data = (
-                    f"Energy (first {time_limit}): {event_list.energy[:time_limit]}"
-                    if event_list.energy is not None
-                    else "Energy: Not available"
-                )
                 preview_data.append(
-                    f"Event List - {file_name}:\n{time_data}\n{mjdref}\n{gti}\n{pi_data}\n{energy_data}\n"
+                    get_event_list_preview(file_name, event_list, time_limit)
                 )
             except Exception as e:
                 warning_handler.warn(str(e), category=RuntimeWarning)
@@ -576,15 +1257,12 @@ def preview_loaded_files(
     if loaded_light_curve:
         for lc_name, lightcurve in loaded_light_curve:
             try:
-                time_data = (
-                    f"Times (first {time_limit}): {lightcurve.time[:time_limit]}"
-                )
-                counts_data = (
-                    f"Counts (first {time_limit}): {lightcurve.counts[:time_limit]}"
-                )
-                dt = f"dt: {lightcurve.dt}"
+                # Format each summary in one pass, without intermediate strings
                 preview_data.append(
-                    f"Light Curve - {lc_name}:\n{time_data}\n{counts_data}\n{dt}\n"
+                    f"Light Curve - {lc_name}:\n"
+                    f"Times (first {time_limit}): {lightcurve.time[:time_limit]}\n"
+                    f"Counts (first {time_limit}): {lightcurve.counts[:time_limit]}\n"
+                    f"dt: {lightcurve.dt}\n"
                 )
             except Exception as e:
                 warning_handler.warn(str(e), category=RuntimeWarning)
@@ -603,7 +1281,7 @@ def preview_loaded_files(
 
     if warning_handler.warnings:
         warning_box_container[:] = [
-            create_loadingdata_warning_box("\n".join(warning_handler.warnings))
+            create_loadingdata_warning_box(warning_handler.format_all())
         ]
     else:
         warning_box_container[:] = [create_loadingdata_warning_box("No warnings.")]
@@ -621,7 +1299,7 @@ def clear_loaded_files(event, output_box_container, warning_box_container):
         warning_box_container (WarningBox): The container for warning messages.
 
     Side effects:
-        - Clears the global `loaded_event_data` and `loaded_light_curve` lists.
+        - Clears the global `loaded_event_data` dict and `loaded_light_curve` list.
         - Updates the output and warning containers with messages.
 
     Exceptions:
@@ -639,9 +1317,11 @@ def clear_loaded_files(event, output_box_container, warning_box_container):
     light_curve_data_cleared = False
 
     # Clear EventList data
-    if loaded_event_data:
-        loaded_event_data.clear()
-        event_data_cleared = True
+    with loaded_data_lock:
+        if loaded_event_data:
+            loaded_event_data.clear()
+            event_list_previews.clear()
+            event_data_cleared = True
 
     # Clear Lightcurve data
     if loaded_light_curve:
@@ -700,6 +1380,8 @@ def create_event_list(
     Exceptions:
         - Displays exceptions in the warning box if event list creation fails.
     """
+    from stingray.events import EventList
+
     try:
         
         # Mandatory input validation
@@ -756,15 +1438,6 @@ def create_event_list(
         notes = notes_input.value.strip() or None
         name = name_input.value.strip() or f"event_list_{len(loaded_event_data)}"
 
-        # Check for duplicates
-        if any(name == event[0] for event in loaded_event_data):
-            output_box_container[:] = [
-                create_loadingdata_output_box(
-                    f"A file with the name '{name}' already exists in memory. Please provide a different name."
-                )
-            ]
-            return
-
         # Create EventList
         event_list = EventList(
             time=times,
@@ -787,8 +1460,16 @@ def create_event_list(
             notes=notes,
         )
 
-        # Store the EventList
-        loaded_event_data.append((name, event_list))
+        # Store the EventList, unless the name is already taken
+        with loaded_data_lock:
+            if name in loaded_event_data:
+                output_box_container[:] = [
+                    create_loadingdata_output_box(
+                        f"A file with the name '{name}' already exists in memory. Please provide a different name."
+                    )
+                ]
+                return
+            loaded_event_data[name] = event_list
 
         output_box_container[:] = [
             create_loadingdata_output_box(
@@ -811,7 +1492,7 @@ def create_event_list(
 
     if warning_handler.warnings:
         warning_box_container[:] = [
-            create_loadingdata_warning_box("\n".join(warning_handler.warnings))
+            create_loadingdata_warning_box(warning_handler.format_all())
         ]
     else:
         warning_box_container[:] = [create_loadingdata_warning_box("No warnings.")]
@@ -858,9 +1539,11 @@ def simulate_event_list(
         >>> simulate_event_list(event, time_slider, count_slider, dt_input, name_input, method_selector, ...)
         "Event List simulated successfully!"
     """
+    from stingray import Lightcurve
+    from stingray.events import EventList
+
     # Clear previous warnings
     warning_handler.warnings.clear()
-    warnings.resetwarnings()
 
     try:
         if not name_input.value:
@@ -871,7 +1554,7 @@ def simulate_event_list(
             ]
             return
 
-        if any(name_input.value == event[0] for event in loaded_event_data):
+        if name_input.value in loaded_event_data:
             output_box_container[:] = [
                 create_loadingdata_output_box(
                     f"A file with the name '{name_input.value}' already exists in memory. Please provide a different name."
@@ -884,8 +1567,8 @@ def simulate_event_list(
         max_counts = max_counts_input.value
         dt = dt_input.value
 
-        # Simulate the light curve
-        times = np.arange(time_bins)
+        # Simulate the light curve, building float64 arrays so Lightcurve needs no dtype conversion
+        times = np.arange(time_bins, dtype=np.float64)
         counts = np.floor(np.random.rand(time_bins) * max_counts)
         lc = Lightcurve(times, counts, dt=dt, skip_checks=True)
 
@@ -896,7 +1579,15 @@ def simulate_event_list(
             event_list.simulate_times(lc)
 
         name = name_input.value
-        loaded_event_data.append((name, event_list))
+        with loaded_data_lock:
+            if name in loaded_event_data:
+                output_box_container[:] = [
+                    create_loadingdata_output_box(
+                        f"A file with the name '{name}' already exists in memory. Please provide a different name."
+                    )
+                ]
+                return
+            loaded_event_data[name] = event_list
 
         output_box_container[:] = [
             create_loadingdata_output_box(
@@ -909,7 +1600,7 @@ def simulate_event_list(
 
     if warning_handler.warnings:
         warning_box_container[:] = [
-            create_loadingdata_warning_box("\n".join(warning_handler.warnings))
+            create_loadingdata_warning_box(warning_handler.format_all())
         ]
     else:
         warning_box_container[:] = [create_loadingdata_warning_box("No warnings.")]
@@ -934,6 +1625,7 @@ def create_loading_tab(output_box_container, warning_box_container, warning_hand
         >>> isinstance(tab, pn.Column)
         True
     """
+    from bokeh.models import Tooltip
 
     # Get the user's home directory
     home_directory = os.path.expanduser("~")
@@ -948,11 +1640,11 @@ def create_loading_tab(output_box_container, warning_box_container, warning_hand
     )
     format_input = pn.widgets.TextInput(
         name="Enter Formats",
-        placeholder="Enter formats (e.g., ogip, pickle, hdf5), comma-separated",
+        placeholder="Enter formats (e.g., ogip, pickle, hdf5, npz), comma-separated",
         width=400,
     )
     format_checkbox = pn.widgets.Checkbox(
-        name='Use default format ("ogip" for reading, "hdf5" for writing/saving)',
+        name=f'Use default format ("ogip" for reading, a single "{CONSOLIDATED_FILE_NAME}" file for writing/saving)',
         value=False,
     )
     load_button = pn.widgets.Button(name="Read as EventLists", button_type="primary")
@@ -1010,76 +1702,75 @@ def create_loading_tab(output_box_container, warning_box_container, warning_hand
         name="Additional Columns (optional)", placeholder="Comma-separated column names"
     )
 
-    def on_load_click(event):
+    async def on_load_click(event):
         # Clear previous outputs and warnings
         output_box_container[:] = [create_loadingdata_output_box("N.A.")]
         warning_box_container[:] = [create_loadingdata_warning_box("N.A.")]
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-
-        read_event_data(
-            event,
-            file_selector,
-            filename_input,
-            format_input,
-            format_checkbox,
-            rmf_file_dropper,
-            additional_columns_input,
-            output_box_container,
-            warning_box_container,
-            warning_handler,
-        )
+        # Read in a worker thread so the server stays responsive during large reads
+        with capture_warnings(warning_handler):
+            await asyncio.to_thread(
+                read_event_data,
+                event,
+                file_selector,
+                filename_input,
+                format_input,
+                format_checkbox,
+                rmf_file_dropper,
+                additional_columns_input,
+                output_box_container,
+                warning_box_container,
+                warning_handler,
+            )
 
-    def on_save_click(event):
+    async def on_save_click(event):
         # Clear previous outputs and warnings
         output_box_container[:] = [create_loadingdata_output_box("N.A.")]
         warning_box_container[:] = [create_loadingdata_warning_box("N.A.")]
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-
-        save_loaded_files(
-            event,
-            filename_input,
-            format_input,
-            format_checkbox,
-            output_box_container,
-            warning_box_container,
-            warning_handler,
-        )
+        with capture_warnings(warning_handler):
+            await asyncio.to_thread(
+                save_loaded_files,
+                event,
+                filename_input,
+                format_input,
+                format_checkbox,
+                output_box_container,
+                warning_box_container,
+                warning_handler,
+            )
 
-    def on_delete_click(event):
+    async def on_delete_click(event):
         # Clear previous outputs and warnings
         warning_box_container[:] = [create_loadingdata_warning_box("N.A.")]
         output_box_container[:] = [create_loadingdata_output_box("N.A.")]
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-
-        delete_selected_files(
-            event,
-            file_selector,
-            warning_box_container,
-            output_box_container,
-            warning_handler,
-        )
+        with capture_warnings(warning_handler):
+            delete_selected_files(
+                event,
+                file_selector,
+                warning_box_container,
+                output_box_container,
+                warning_handler,
+            )
 
-    def on_preview_click(event):
+    async def on_preview_click(event):
         # Clear previous outputs and warnings
         output_box_container[:] = [create_loadingdata_output_box("N.A.")]
         warning_box_container[:] = [create_loadingdata_warning_box("N.A.")]
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-
-        preview_loaded_files(
-            event, output_box_container, warning_box_container, warning_handler
-        )
+        with capture_warnings(warning_handler):
+            preview_loaded_files(
+                event, output_box_container, warning_box_container, warning_handler
+            )
 
-    def on_clear_click(event):
+    async def on_clear_click(event):
         # Clear the loaded files list
         output_box_container[:] = [create_loadingdata_output_box("N.A.")]
         warning_box_container[:] = [create_loadingdata_warning_box("N.A.")]
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-        clear_loaded_files(event, output_box_container, warning_box_container)
+        with capture_warnings(warning_handler):
+            clear_loaded_files(event, output_box_container, warning_box_container)
 
     load_button.on_click(on_load_click)
     save_button.on_click(on_save_click)
@@ -1191,38 +1882,37 @@ def create_event_list_tab(output_box_container, warning_box_container, warning_h
     # Create button
     create_button = pn.widgets.Button(name="Create Event List", button_type="primary")
 
-    def on_create_button_click(event):
+    async def on_create_button_click(event):
         # Clear previous output and warnings
         output_box_container.clear()
         warning_box_container.clear()
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-
-        create_event_list(
-            event,
-            times_input,
-            energy_input,
-            pi_input,
-            gti_input,
-            mjdref_input,
-            dt_input,
-            # ncounts_input,
-            high_precision_checkbox,
-            mission_input,
-            instr_input,
-            detector_id_input,
-            header_input,
-            timeref_input,
-            timesys_input,
-            ephem_input,
-            # rmf_file_input,
-            skip_checks_checkbox,
-            notes_input,
-            name_input,
-            output_box_container,
-            warning_box_container,
-            warning_handler,
-        )
+        with capture_warnings(warning_handler):
+            create_event_list(
+                event,
+                times_input,
+                energy_input,
+                pi_input,
+                gti_input,
+                mjdref_input,
+                dt_input,
+                # ncounts_input,
+                high_precision_checkbox,
+                mission_input,
+                instr_input,
+                detector_id_input,
+                header_input,
+                timeref_input,
+                timesys_input,
+                ephem_input,
+                # rmf_file_input,
+                skip_checks_checkbox,
+                notes_input,
+                name_input,
+                output_box_container,
+                warning_box_container,
+                warning_handler,
+            )
 
     create_button.on_click(on_create_button_click)
 
@@ -1297,25 +1987,24 @@ def create_simulate_event_list_tab(
         name="Simulate Event List", button_type="primary"
     )
 
-    def on_simulate_button_click(event):
+    async def on_simulate_button_click(event):
         # Clear previous output and warnings
         output_box_container[:] = [create_loadingdata_output_box("N.A.")]
         warning_box_container[:] = [create_loadingdata_warning_box("N.A.")]
         warning_handler.warnings.clear()
-        warnings.resetwarnings()
-
-        # Simulate the event list
-        simulate_event_list(
-            event,
-            time_bins_input,
-            max_counts_input,
-            dt_input,
-            sim_name_input,
-            method_selector,
-            output_box_container,
-            warning_box_container,
-            warning_handler,
-        )
+        with capture_warnings(warning_handler):
+            # Simulate the event list
+            simulate_event_list(
+                event,
+                time_bins_input,
+                max_counts_input,
+                dt_input,
+                sim_name_input,
+                method_selector,
+                output_box_container,
+                warning_box_container,
+                warning_handler,
+            )
 
     simulate_button.on_click(on_simulate_button_click)
 
@@ -1361,18 +2050,22 @@ def create_loadingdata_main_area(
         True
     """
     warning_handler = create_warning_handler()
+    # Tabs are built when first shown, so the file selector only scans the disk on demand
     tabs_content = {
-        "Read Event List from File": create_loading_tab(
+        "Read Event List from File": pn.bind(
+            create_loading_tab,
             output_box_container=output_box_container,
             warning_box_container=warning_box_container,
             warning_handler=warning_handler,
         ),
-        "Create Event List": create_event_list_tab(
+        "Create Event List": pn.bind(
+            create_event_list_tab,
             output_box_container=output_box_container,
             warning_box_container=warning_box_container,
             warning_handler=warning_handler,
         ),
-        "Simulate Event List": create_simulate_event_list_tab(
+        "Simulate Event List": pn.bind(
+            create_simulate_event_list_tab,
             output_box_container=output_box_container,
             warning_box_container=warning_box_container,
             warning_handler=warning_handler,
@@ -82,17 +82,17 @@ def create_home_main_area() -> MainArea:
     file_path2 = os.path.join(data_dir, target_file2)
 
     # Check if the file is already loaded
-    if not any(file_name == "nomission" for file_name, _ in loaded_event_data):
+    if "nomission" not in loaded_event_data:
         try:
             event_list = EventList.read(file_path1, "ogip")
-            loaded_event_data.append(("nomission", event_list))
+            loaded_event_data["nomission"] = event_list
             print(f"File '{target_file1}' loaded successfully.")
         except Exception as e:
             print(f"Failed to load file '{target_file1}': {e}")
-    if not any(file_name == "xte_test" for file_name, _ in loaded_event_data):
+    if "xte_test.evt.gz" not in loaded_event_data:
         try:
             event_list = EventList.read(file_path2, "ogip")
-            loaded_event_data.append(("xte_test.evt.gz", event_list))
+            loaded_event_data["xte_test.evt.gz"] = event_list
             print(f"File '{target_file2}' loaded successfully.")
         except Exception as e:
             print(f"Failed to load file '{target_file2}': {e}")
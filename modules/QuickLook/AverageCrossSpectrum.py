@@ -65,12 +65,12 @@ def create_avg_cross_spectrum_tab(
     # Define Widgets
     event_list_dropdown_1 = pn.widgets.Select(
         name="Select Event List 1",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     event_list_dropdown_2 = pn.widgets.Select(
         name="Select Event List 2",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     dt_slider = pn.widgets.FloatSlider(
@@ -99,16 +99,16 @@ def create_avg_cross_spectrum_tab(
         name="Add DataFrame to FloatingPanel", value=False
     )
 
-    def create_dataframe(selected_event_list_index_1, selected_event_list_index_2, dt, norm, segment_size):
-        if selected_event_list_index_1 is not None and selected_event_list_index_2 is not None:
-            event_list_1 = loaded_event_data[selected_event_list_index_1][1]
-            event_list_2 = loaded_event_data[selected_event_list_index_2][1]
+    def create_dataframe(selected_event_list_name_1, selected_event_list_name_2, dt, norm, segment_size):
+        if selected_event_list_name_1 is not None and selected_event_list_name_2 is not None:
+            event_list_1 = loaded_event_data[selected_event_list_name_1]
+            event_list_2 = loaded_event_data[selected_event_list_name_2]
 
-            # Create an AveragedCrossspectrum object using from_lightcurve
+            # Create an AveragedCrossspectrum object using from_events
             try:
-                lc1 = event_list_1.to_lc(dt=dt)
-                lc2 = event_list_2.to_lc(dt=dt)
-                cs = AveragedCrossspectrum.from_lightcurve(lc1, lc2, segment_size, norm=norm)
+                cs = AveragedCrossspectrum.from_events(
+                    event_list_1, event_list_2, dt, segment_size, norm=norm
+                )
 
                 df = pd.DataFrame(
                     {
@@ -181,9 +181,9 @@ def create_avg_cross_spectrum_tab(
             ]
             return
 
-        selected_event_list_index_1 = event_list_dropdown_1.value
-        selected_event_list_index_2 = event_list_dropdown_2.value
-        if selected_event_list_index_1 is None or selected_event_list_index_2 is None:
+        selected_event_list_name_1 = event_list_dropdown_1.value
+        selected_event_list_name_2 = event_list_dropdown_2.value
+        if selected_event_list_name_1 is None or selected_event_list_name_2 is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("Both event lists must be selected.")
             ]
@@ -192,9 +192,9 @@ def create_avg_cross_spectrum_tab(
         dt = dt_slider.value
         norm = norm_select.value
         segment_size = segment_size_input.value
-        df, cs = create_dataframe(selected_event_list_index_1, selected_event_list_index_2, dt, norm, segment_size)
+        df, cs = create_dataframe(selected_event_list_name_1, selected_event_list_name_2, dt, norm, segment_size)
         if df is not None:
-            plot_title = f"Averaged Cross Spectrum for {loaded_event_data[selected_event_list_index_1][0]} vs {loaded_event_data[selected_event_list_index_2][0]}"
+            plot_title = f"Averaged Cross Spectrum for {selected_event_list_name_1} vs {selected_event_list_name_2}"
             plot_hv = create_holoviews_plots(cs, title=plot_title, dt=dt, norm=norm, segment_size=segment_size)
             holoviews_output = create_holoviews_panes(plot_hv)
 
@@ -231,9 +231,9 @@ def create_avg_cross_spectrum_tab(
             ]
             return
 
-        selected_event_list_index_1 = event_list_dropdown_1.value
-        selected_event_list_index_2 = event_list_dropdown_2.value
-        if selected_event_list_index_1 is None or selected_event_list_index_2 is None:
+        selected_event_list_name_1 = event_list_dropdown_1.value
+        selected_event_list_name_2 = event_list_dropdown_2.value
+        if selected_event_list_name_1 is None or selected_event_list_name_2 is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("Both event lists must be selected.")
             ]
@@ -242,14 +242,14 @@ def create_avg_cross_spectrum_tab(
         dt = dt_slider.value
         norm = norm_select.value
         segment_size = segment_size_input.value
-        df, cs = create_dataframe(selected_event_list_index_1, selected_event_list_index_2, dt, norm, segment_size)
+        df, cs = create_dataframe(selected_event_list_name_1, selected_event_list_name_2, dt, norm, segment_size)
         if df is not None:
-            dataframe_output = create_dataframe_panes(df, f"{loaded_event_data[selected_event_list_index_1][0]} vs {loaded_event_data[selected_event_list_index_2][0]}", dt, norm, segment_size)
+            dataframe_output = create_dataframe_panes(df, f"{selected_event_list_name_1} vs {selected_event_list_name_2}", dt, norm, segment_size)
             if dataframe_checkbox.value:
                 float_panel_container.append(
                     create_floatpanel_area(
                         content=dataframe_output,
-                        title=f"DataFrame for {loaded_event_data[selected_event_list_index_1][0]} vs {loaded_event_data[selected_event_list_index_2][0]}",
+                        title=f"DataFrame for {selected_event_list_name_1} vs {selected_event_list_name_2}",
                     )
                 )
             else:
@@ -104,7 +104,7 @@ def create_avg_powerspectrum_tab(
     # Define Widgets
     event_list_dropdown = pn.widgets.Select(
         name="Select Event List(s)",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     dt_input = pn.widgets.FloatInput(
@@ -125,7 +125,7 @@ def create_avg_powerspectrum_tab(
 
     multi_event_select = pn.widgets.MultiSelect(
         name="Or Select Event List(s) to Combine",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
         size=8,
     )
 
@@ -167,13 +167,13 @@ def create_avg_powerspectrum_tab(
 
     def update_time_info(event):
 
-        selected_index = event_list_dropdown.value
+        selected_name = event_list_dropdown.value
 
-        if selected_index is not None:
+        if selected_name is not None:
 
-            event_list_name = loaded_event_data[selected_index][0]
+            event_list_name = selected_name
 
-            event_list = loaded_event_data[selected_index][1]
+            event_list = loaded_event_data[selected_name]
 
             start_time = event_list.time[0]
 
@@ -190,14 +190,15 @@ def create_avg_powerspectrum_tab(
             time_info_pane.object = "Select an event list to see time range"
 
     # Internal functions to encapsulate functionality
-    def create_dataframe(selected_event_list_index, dt, norm, segment_size):
-        if selected_event_list_index is not None:
-            event_list = loaded_event_data[selected_event_list_index][1]
+    def create_dataframe(selected_event_list_name, dt, norm, segment_size):
+        if selected_event_list_name is not None:
+            event_list = loaded_event_data[selected_event_list_name]
 
-            # Create an AveragedPowerspectrum object using from_lightcurve
+            # Create an AveragedPowerspectrum object using from_events
             try:
-                lc = event_list.to_lc(dt=dt)
-                ps = AveragedPowerspectrum.from_lightcurve(lc, segment_size, norm=norm)
+                ps = AveragedPowerspectrum.from_events(
+                    event_list, dt, segment_size, norm=norm
+                )
 
                 df = pd.DataFrame(
                     {
@@ -282,6 +283,9 @@ def create_avg_powerspectrum_tab(
 
         if linear_rebin_checkbox.value:
 
+            # Rebinning to the current resolution is a no-op; skip the copy
+            if abs(rebin_size - ps.df) < 1e-12 * ps.df:
+                return ps
             return ps.rebin(rebin_size, method="mean")
 
         elif log_rebin_checkbox.value:
@@ -344,8 +348,8 @@ def create_avg_powerspectrum_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -354,9 +358,9 @@ def create_avg_powerspectrum_tab(
         dt = dt_input.value
         norm = norm_select.value
         segment_size = segment_size_input.value
-        df, ps = create_dataframe(selected_event_list_index, dt, norm, segment_size)
+        df, ps = create_dataframe(selected_event_list_name, dt, norm, segment_size)
         if df is not None:
-            plot_title = f"Averaged Power Spectrum for {loaded_event_data[selected_event_list_index][0]}"
+            plot_title = f"Averaged Power Spectrum for {selected_event_list_name}"
             plot_hv = create_holoviews_plots(
                 ps, title=plot_title, dt=dt, norm=norm, segment_size=segment_size
             )
@@ -397,8 +401,8 @@ def create_avg_powerspectrum_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -407,11 +411,11 @@ def create_avg_powerspectrum_tab(
         dt = dt_input.value
         norm = norm_select.value
         segment_size = segment_size_input.value
-        df, ps = create_dataframe(selected_event_list_index, dt, norm, segment_size)
+        df, ps = create_dataframe(selected_event_list_name, dt, norm, segment_size)
         if df is not None:
             dataframe_output = create_dataframe_panes(
                 df,
-                f"{loaded_event_data[selected_event_list_index][0]}",
+                f"{selected_event_list_name}",
                 dt,
                 norm,
                 segment_size,
@@ -420,7 +424,7 @@ def create_avg_powerspectrum_tab(
                 float_panel_container.append(
                     create_floatpanel_area(
                         content=dataframe_output,
-                        title=f"DataFrame for {loaded_event_list[selected_event_list_index][0]}",
+                        title=f"DataFrame for {selected_event_list_name}",
                     )
                 )
             else:
@@ -434,8 +438,8 @@ def create_avg_powerspectrum_tab(
             ]
 
     def combine_selected_plots(event=None):
-        selected_event_list_indices = multi_event_select.value
-        if not selected_event_list_indices:
+        selected_event_list_names = multi_event_select.value
+        if not selected_event_list_names:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event lists selected.")
             ]
@@ -444,13 +448,13 @@ def create_avg_powerspectrum_tab(
         combined_plots = []
         combined_title = []
 
-        for index in selected_event_list_indices:
+        for name in selected_event_list_names:
             dt = dt_input.value
             norm = norm_select.value
             segment_size = segment_size_input.value
-            df, ps = create_dataframe(index, dt, norm, segment_size)
+            df, ps = create_dataframe(name, dt, norm, segment_size)
             if df is not None:
-                event_list_name = loaded_event_data[index][0]
+                event_list_name = name
                 plot_hv = create_holoviews_plots_no_colorbar(
                     ps,
                     title=event_list_name,
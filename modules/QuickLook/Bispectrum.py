@@ -104,7 +104,7 @@ def create_bispectrum_tab(
     
     event_list_dropdown = pn.widgets.Select(
         name="Select Event List",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
     dt_input = pn.widgets.FloatInput(name="Select dt", value=1.0, step=0.0001, start=0.0001, end=1000.0)
     maxlag_input = pn.widgets.IntInput(name="Max Lag", value=25, step=1, start=1, end=100)
@@ -118,9 +118,9 @@ def create_bispectrum_tab(
         name="Add DataFrame to FloatingPanel", value=False
     )
     
-    def create_bispectrum(selected_event_index, dt, maxlag, scale, window):
+    def create_bispectrum(selected_event_name, dt, maxlag, scale, window):
         try:
-            event_list = loaded_event_data[selected_event_index][1]
+            event_list = loaded_event_data[selected_event_name]
             # Use `to_lc` for efficient light curve creation
             lc = event_list.to_lc(dt=dt)
 
@@ -178,11 +178,11 @@ def create_bispectrum_tab(
             flex_direction="column",
         )
 
-    def create_dataframe(selected_event_list_index, dt, maxlag, scale, window):
-        if selected_event_list_index is not None:
+    def create_dataframe(selected_event_list_name, dt, maxlag, scale, window):
+        if selected_event_list_name is not None:
             try:
                 # Fetch the selected EventList
-                event_list = loaded_event_data[selected_event_list_index][1]
+                event_list = loaded_event_data[selected_event_list_name]
 
                 # Convert EventList to Lightcurve
                 lc = event_list.to_lc(dt=dt)
@@ -190,15 +190,16 @@ def create_bispectrum_tab(
                 # Generate the Bispectrum
                 bs = Bispectrum(lc, maxlag=maxlag, window=window, scale=scale)
 
-                # Create 2D grids for Frequency and Lags
-                freq_grid, lags_grid = np.meshgrid(bs.freq, bs.lags)
+                # Broadcast Frequency and Lags onto the (lags, freq) grid without
+                # materializing meshgrid copies
+                grid_shape = (len(bs.lags), len(bs.freq))
+                freq_flat = np.broadcast_to(bs.freq[None, :], grid_shape).ravel()
+                lags_flat = np.broadcast_to(bs.lags[:, None], grid_shape).ravel()
 
-                # Flatten grids and corresponding Bispectrum data
-                freq_flat = freq_grid.flatten()
-                lags_flat = lags_grid.flatten()
-                mag_flat = bs.bispec_mag.flatten()
-                phase_flat = bs.bispec_phase.flatten()
-                cum3_flat = bs.cum3.flatten()
+                # Flatten the Bispectrum data as views where the arrays are contiguous
+                mag_flat = bs.bispec_mag.ravel()
+                phase_flat = bs.bispec_phase.ravel()
+                cum3_flat = bs.cum3.ravel()
 
                 # Ensure all arrays are of the same length
                 if not (
@@ -206,15 +207,14 @@ def create_bispectrum_tab(
                 ):
                     raise ValueError("Inconsistent lengths of Bispectrum data.")
 
-                # Create DataFrame
+                # Create the DataFrame from one stacked block so pandas does not copy
+                # each column into its own block
                 df = pd.DataFrame(
-                    {
-                        "Frequency": freq_flat,
-                        "Lags": lags_flat,
-                        "Cumulant (Cum3)": cum3_flat,
-                        "Magnitude": mag_flat,
-                        "Phase": phase_flat,
-                    }
+                    np.column_stack(
+                        [freq_flat, lags_flat, cum3_flat, mag_flat, phase_flat]
+                    ),
+                    columns=["Frequency", "Lags", "Cumulant (Cum3)", "Magnitude", "Phase"],
+                    copy=False,
                 )
                 return df, bs
             except Exception as e:
@@ -239,8 +239,8 @@ def create_bispectrum_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -250,9 +250,9 @@ def create_bispectrum_tab(
         maxlag = maxlag_input.value
         scale = scale_select.value
         window = window_select.value
-        df, bs = create_dataframe(selected_event_list_index, dt, maxlag, scale, window)
+        df, bs = create_dataframe(selected_event_list_name, dt, maxlag, scale, window)
         if df is not None:
-            event_list_name = loaded_event_data[selected_event_list_index][0]
+            event_list_name = selected_event_list_name
             dataframe_title = f"{event_list_name} (dt={dt}, maxlag={maxlag}, scale={scale}, window={window})"
             dataframe_output = create_dataframe_panes(df, dataframe_title)
             if dataframe_checkbox.value:
@@ -275,8 +275,8 @@ def create_bispectrum_tab(
             output_box_container[:] = [pn.pane.Markdown("No event data available.")]
             return
 
-        selected_index = event_list_dropdown.value
-        if selected_index is None:
+        selected_name = event_list_dropdown.value
+        if selected_name is None:
             output_box_container[:] = [pn.pane.Markdown("Select an event list.")]
             return
 
@@ -286,11 +286,11 @@ def create_bispectrum_tab(
         window = window_select.value
         vis_type = visualization_select.value
 
-        bs = create_bispectrum(selected_index, dt, maxlag, scale, window)
+        bs = create_bispectrum(selected_name, dt, maxlag, scale, window)
         if bs:
             pane = visualize_bispectrum(bs, vis_type)
             if pane:
-                title = f"Bispectrum ({vis_type}) for Event {loaded_event_data[selected_index][0]}"
+                title = f"Bispectrum ({vis_type}) for Event {selected_name}"
                 if floatpanel_checkbox.value:
                     float_panel_container.append(FloatingPlot(title=title, content=pane))
                 else:
@@ -64,12 +64,12 @@ def create_cross_spectrum_tab(
 ):
     event_list_dropdown_1 = pn.widgets.Select(
         name="Select Event List 1",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     event_list_dropdown_2 = pn.widgets.Select(
         name="Select Event List 2",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     dt_slider = pn.widgets.FloatSlider(
@@ -118,10 +118,10 @@ def create_cross_spectrum_tab(
             flex_direction="column",
         )
 
-    def create_dataframe(selected_event_list_index_1, selected_event_list_index_2, dt, norm):
-        if selected_event_list_index_1 is not None and selected_event_list_index_2 is not None:
-            event_list_1 = loaded_event_data[selected_event_list_index_1][1]
-            event_list_2 = loaded_event_data[selected_event_list_index_2][1]
+    def create_dataframe(selected_event_list_name_1, selected_event_list_name_2, dt, norm):
+        if selected_event_list_name_1 is not None and selected_event_list_name_2 is not None:
+            event_list_1 = loaded_event_data[selected_event_list_name_1]
+            event_list_2 = loaded_event_data[selected_event_list_name_2]
 
             try:
                 # Ensure GTIs are not empty before proceeding
@@ -171,9 +171,9 @@ def create_cross_spectrum_tab(
             ]
             return
 
-        selected_event_list_index_1 = event_list_dropdown_1.value
-        selected_event_list_index_2 = event_list_dropdown_2.value
-        if selected_event_list_index_1 is None or selected_event_list_index_2 is None:
+        selected_event_list_name_1 = event_list_dropdown_1.value
+        selected_event_list_name_2 = event_list_dropdown_2.value
+        if selected_event_list_name_1 is None or selected_event_list_name_2 is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("Both event lists must be selected.")
             ]
@@ -181,10 +181,10 @@ def create_cross_spectrum_tab(
 
         dt = dt_slider.value
         norm = norm_select.value
-        df, cs = create_dataframe(selected_event_list_index_1, selected_event_list_index_2, dt, norm)
+        df, cs = create_dataframe(selected_event_list_name_1, selected_event_list_name_2, dt, norm)
         if df is not None:
-            event_list_name_1 = loaded_event_data[selected_event_list_index_1][0]
-            event_list_name_2 = loaded_event_data[selected_event_list_index_2][0]
+            event_list_name_1 = selected_event_list_name_1
+            event_list_name_2 = selected_event_list_name_2
             dataframe_title = f"{event_list_name_1} vs {event_list_name_2} (dt={dt}, norm={norm})"
             dataframe_output = create_dataframe_panes(df, dataframe_title)
             if dataframe_checkbox.value:
@@ -208,9 +208,9 @@ def create_cross_spectrum_tab(
             ]
             return
 
-        selected_event_list_index_1 = event_list_dropdown_1.value
-        selected_event_list_index_2 = event_list_dropdown_2.value
-        if selected_event_list_index_1 is None or selected_event_list_index_2 is None:
+        selected_event_list_name_1 = event_list_dropdown_1.value
+        selected_event_list_name_2 = event_list_dropdown_2.value
+        if selected_event_list_name_1 is None or selected_event_list_name_2 is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("Both event lists must be selected.")
             ]
@@ -218,10 +218,10 @@ def create_cross_spectrum_tab(
 
         dt = dt_slider.value
         norm = norm_select.value
-        df, cs = create_dataframe(selected_event_list_index_1, selected_event_list_index_2, dt, norm)
+        df, cs = create_dataframe(selected_event_list_name_1, selected_event_list_name_2, dt, norm)
         if df is not None:
-            event_list_name_1 = loaded_event_data[selected_event_list_index_1][0]
-            event_list_name_2 = loaded_event_data[selected_event_list_index_2][0]
+            event_list_name_1 = selected_event_list_name_1
+            event_list_name_2 = selected_event_list_name_2
             plot_hv = create_holoviews_plots(cs, event_list_name_1, event_list_name_2, dt, norm)
             holoviews_output = create_holoviews_panes(plot_hv)
 
@@ -73,7 +73,7 @@ def create_dynamicalpowerspectrum_tab(
 ):
     event_list_dropdown = pn.widgets.Select(
         name="Select Event List(s)",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     segment_size_input = pn.widgets.FloatInput(name="Segment Size", value=10, step=1)
@@ -102,9 +102,9 @@ def create_dynamicalpowerspectrum_tab(
         name="Add DataFrame to FloatingPanel", value=False
     )
 
-    def create_dataframe(selected_event_list_index, dt, segment_size, norm):
-        if selected_event_list_index is not None:
-            event_list = loaded_event_data[selected_event_list_index][1]
+    def create_dataframe(selected_event_list_name, dt, segment_size, norm):
+        if selected_event_list_name is not None:
+            event_list = loaded_event_data[selected_event_list_name]
             lc = event_list.to_lc(dt=dt)
             dps = DynamicalPowerspectrum(lc, segment_size=segment_size, norm=norm)
             return dps
@@ -129,8 +129,8 @@ def create_dynamicalpowerspectrum_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -150,7 +150,7 @@ def create_dynamicalpowerspectrum_tab(
         norm = norm_select.value
 
         # Directly create DynamicalPowerspectrum
-        event_list = loaded_event_data[selected_event_list_index][1]
+        event_list = loaded_event_data[selected_event_list_name]
         lc = event_list.to_lc(dt=dt)
         dps = DynamicalPowerspectrum(lc, segment_size=segment_size, norm=norm)
         if dps:
@@ -1,3 +1,9 @@
+import os
+import atexit
+import shutil
+import tempfile
+import weakref
+import numpy as np
 import panel as pn
 import holoviews as hv
 import holoviews.operation.datashader as hd
@@ -5,6 +11,7 @@ from holoviews.operation.timeseries import rolling, rolling_outlier_std
 from utils.globals import loaded_event_data, loaded_light_curve
 import pandas as pd
 import warnings
+from stingray import Lightcurve
 import hvplot.pandas
 from utils.DashboardClasses import (
     MainHeader,
@@ -41,6 +48,123 @@ colors = [
     "#9edae5",
 ]
 
+# Light curves whose time and counts arrays exceed this are kept memory-mapped from disk
+LIGHTCURVE_SPILL_BYTES = 64 * 1024 * 1024
+
+# Directory holding the spill files of every dashboard process, one subdirectory per PID
+LIGHTCURVE_SPILL_ROOT = os.path.join(tempfile.gettempdir(), "stingray-explorer-spill")
+
+# Spill directory of this process, removed at exit and swept by the next process that
+# spills after a crash
+lightcurve_spill_path = os.path.join(LIGHTCURVE_SPILL_ROOT, str(os.getpid()))
+
+# Whether this process has created its spill directory and registered its removal
+_spill_dir_prepared = False
+
+
+def _remove_spill_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _process_is_running(pid):
+    # os.kill cannot probe a process on Windows without terminating it
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def remove_stale_spill_dirs():
+    """
+    Remove the spill directories left behind by dashboard processes that are no longer running.
+    """
+    try:
+        entries = list(os.scandir(LIGHTCURVE_SPILL_ROOT))
+    except OSError:
+        return
+    for entry in entries:
+        if not (entry.is_dir() and entry.name.isdigit()):
+            continue
+        if not _process_is_running(int(entry.name)):
+            shutil.rmtree(entry.path, ignore_errors=True)
+
+
+def prepare_spill_dir():
+    """
+    Create this process's spill directory and remove it at exit, sweeping the ones left
+    by processes that are no longer running first.
+
+    Runs once, on the first spill, so importing the module touches no files.
+    """
+    global _spill_dir_prepared
+    if _spill_dir_prepared:
+        return
+    remove_stale_spill_dirs()
+    os.makedirs(lightcurve_spill_path, exist_ok=True)
+    atexit.register(shutil.rmtree, lightcurve_spill_path, ignore_errors=True)
+    _spill_dir_prepared = True
+
+
+def spill_lightcurve(lc):
+    """
+    Move the time and counts arrays of a large light curve to `.npy` files in this
+    process's spill directory, and rebuild the light curve on copy-on-write memory maps
+    of them, so the page cache holds them instead of RAM while in-place operations
+    still work.
+
+    Only the time and counts are spilled. The light curve is rebuilt through the
+    `Lightcurve` constructor, so count rates and Poisson errors are derived from the
+    mapped counts as usual; non-Poisson errors are carried over as they are.
+
+    Light curves below `LIGHTCURVE_SPILL_BYTES` are returned unchanged. The files are
+    removed once the rebuilt light curve is garbage collected.
+
+    Returns:
+        Lightcurve: The rebuilt light curve, or `lc` itself if it was not spilled.
+    """
+    if lc.time.nbytes + lc.counts.nbytes <= LIGHTCURVE_SPILL_BYTES:
+        return lc
+
+    prepare_spill_dir()
+    spill_files = []
+    mapped = {}
+    for attribute in ("time", "counts"):
+        with tempfile.NamedTemporaryFile(
+            prefix=f"lightcurve_{attribute}_",
+            suffix=".npy",
+            dir=lightcurve_spill_path,
+            delete=False,
+        ) as f:
+            np.save(f, getattr(lc, attribute))
+        spill_files.append(f.name)
+        mapped[attribute] = np.load(f.name, mmap_mode="c")
+
+    spilled = Lightcurve(
+        mapped["time"],
+        mapped["counts"],
+        err=None if lc.err_dist == "poisson" else lc.counts_err,
+        input_counts=True,
+        gti=lc.gti,
+        err_dist=lc.err_dist,
+        mjdref=lc.mjdref,
+        dt=lc.dt,
+        skip_checks=True,
+        mission=lc.mission,
+        instr=lc.instr,
+        header=lc.header,
+    )
+    for path in spill_files:
+        weakref.finalize(spilled, _remove_spill_file, path)
+    return spilled
+
 
 # Create a warning handler
 def create_warning_handler():
@@ -98,7 +222,7 @@ def create_lightcurve_tab(
 
     event_list_dropdown = pn.widgets.Select(
         name="Select Event List(s)",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     dt_input = pn.widgets.FloatInput(
@@ -111,7 +235,7 @@ def create_lightcurve_tab(
 
     multi_event_select = pn.widgets.MultiSelect(
         name="Or Select Event List(s) to Combine",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
         size=8,
     )
 
@@ -139,10 +263,10 @@ def create_lightcurve_tab(
 
     # Callback to update the time information
     def update_time_info(event):
-        selected_index = event_list_dropdown.value
-        if selected_index is not None:
-            event_list_name = loaded_event_data[selected_index][0]
-            event_list = loaded_event_data[selected_index][1]
+        selected_name = event_list_dropdown.value
+        if selected_name is not None:
+            event_list_name = selected_name
+            event_list = loaded_event_data[selected_name]
             start_time = event_list.time[0]
             end_time = event_list.time[-1]
             time_info_pane.object = (
@@ -258,21 +382,25 @@ def create_lightcurve_tab(
             flex_direction="column",
         )
 
-    def create_dataframe(selected_event_list_index, dt, eventlist_name):
-        if selected_event_list_index is not None:
-            event_list = loaded_event_data[selected_event_list_index][1]
+    def create_dataframe(selected_event_list_name, dt, eventlist_name):
+        if selected_event_list_name is not None:
+            event_list = loaded_event_data[selected_event_list_name]
 
 
             # Parse GTIs from input if provided
             gti = None
             if gti_input.value:
                 try:
-                    gti = [
-                        [float(start), float(end)]
-                        for start, end in (
-                            interval.split() for interval in gti_input.value.split(";")
-                        )
-                    ]
+                    # Parse straight into a float64 (N, 2) array for Stingray's GTI routines
+                    gti = np.asarray(
+                        [
+                            [float(start), float(end)]
+                            for start, end in (
+                                interval.split() for interval in gti_input.value.split(";")
+                            )
+                        ],
+                        dtype=np.float64,
+                    ).reshape(-1, 2)
                 except ValueError:
                     output_box_container[:] = [
                         create_loadingdata_output_box("Invalid GTI format. Use 'start end; start end'.")
@@ -289,13 +417,13 @@ def create_lightcurve_tab(
 
             # Append the generated light curve to loaded_light_curve if the checkbox is checked
             if save_lightcurve_checkbox.value:
-                loaded_light_curve.append((lightcurve_name, lc_new))
+                loaded_light_curve.append((lightcurve_name, spill_lightcurve(lc_new)))
 
+            # Stack both columns once and wrap them without a further per-column copy
             df = pd.DataFrame(
-                {
-                    "Time": lc_new.time,
-                    "Counts": lc_new.counts,
-                }
+                np.column_stack([lc_new.time, lc_new.counts]),
+                columns=["Time", "Counts"],
+                copy=False,
             )
             return df
         return None
@@ -312,17 +440,17 @@ def create_lightcurve_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
             return
 
         dt = dt_input.value
-        df = create_dataframe(selected_event_list_index, dt)
+        df = create_dataframe(selected_event_list_name, dt)
         if df is not None:
-            event_list_name = loaded_event_data[selected_event_list_index][0]
+            event_list_name = selected_event_list_name
             dataframe_output = create_dataframe_panes(df, f"{event_list_name}", dt)
             if dataframe_checkbox.value:
                 float_panel_container.append(
@@ -345,8 +473,8 @@ def create_lightcurve_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -354,12 +482,12 @@ def create_lightcurve_tab(
 
         dt = dt_input.value
         df = create_dataframe(
-            selected_event_list_index,
+            selected_event_list_name,
             dt,
-            loaded_event_data[selected_event_list_index][0],
+            selected_event_list_name,
         )
         if df is not None:
-            event_list_name = loaded_event_data[selected_event_list_index][0]
+            event_list_name = selected_event_list_name
             plot_hv = create_holoviews_plots(df, label=event_list_name, dt=dt)
             holoviews_output = create_holoviews_panes(plot=plot_hv)
 
@@ -386,8 +514,8 @@ def create_lightcurve_tab(
             ]
 
     def combine_selected_plots(event=None):
-        selected_event_list_indices = multi_event_select.value
-        if not selected_event_list_indices:
+        selected_event_list_names = multi_event_select.value
+        if not selected_event_list_names:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event lists selected.")
             ]
@@ -398,17 +526,17 @@ def create_lightcurve_tab(
 
         # Define a color key for distinct colors
         color_key = {
-            index: colors[i % len(colors)]
-            for i, index in enumerate(selected_event_list_indices)
+            name: colors[i % len(colors)]
+            for i, name in enumerate(selected_event_list_names)
         }
 
-        for index in selected_event_list_indices:
+        for name in selected_event_list_names:
             dt = dt_input.value
-            df = create_dataframe(index, dt)
+            df = create_dataframe(name, dt)
             if df is not None:
-                event_list_name = loaded_event_data[index][0]
+                event_list_name = name
                 plot_hv = create_holoviews_plots_no_colorbar(
-                    df, label=event_list_name, dt=dt, color_key=color_key[index]
+                    df, label=event_list_name, dt=dt, color_key=color_key[name]
                 )
                 combined_plots.append(plot_hv)
                 combined_title.append(event_list_name)
@@ -48,7 +48,7 @@ def create_powercolors_tab(
 ):
     event_list_dropdown = pn.widgets.Select(
         name="Select Event List(s)",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=list(loaded_event_data),
     )
 
     segment_size_input = pn.widgets.IntInput(name="Segment Size", value=256, step=1)
@@ -61,8 +61,8 @@ def create_powercolors_tab(
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             warning_box_container[:] = [
                 create_loadingdata_warning_box("No event list selected.")
             ]
@@ -70,7 +70,7 @@ def create_powercolors_tab(
 
         try:
             # Convert EventList to LightCurve
-            event_list = loaded_event_data[selected_event_list_index][1]
+            event_list = loaded_event_data[selected_event_list_name]
             lightcurve = event_list.to_lc(dt=1 / 256)
 
             segment_size = segment_size_input.value
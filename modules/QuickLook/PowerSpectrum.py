@@ -1,10 +1,15 @@
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 import panel as pn
 import holoviews as hv
 from utils.globals import loaded_event_data
+import numpy as np
 import pandas as pd
 import warnings
 import holoviews.operation.datashader as hd
-import hvplot.pandas
+from holoviews.operation.downsample import downsample1d
 from utils.DashboardClasses import (
     MainHeader,
     MainArea,
@@ -16,8 +21,9 @@ from utils.DashboardClasses import (
     FloatingPlot,
     PlotsContainer,
 )
+from scipy import fft as scipy_fft
 from stingray import Powerspectrum
-
+from utils.psd_batch import batch_powerspectra
 
 colors = [
     "#1f77b4",
@@ -44,6 +50,146 @@ colors = [
 
 log_binned = False
 
+# Points per curve sent to the browser when plots are not rasterized
+MAX_PLOT_SAMPLES = 4000
+
+# Rows per page of the power spectrum tables; only the visible page is sent to the browser
+DATAFRAME_PAGE_SIZE = 50
+
+# Number of power spectra kept in `powerspectrum_cache`
+POWERSPECTRUM_CACHE_SIZE = 32
+
+# Most recently computed power spectra, keyed by (event list name, dt, norm), least recent first
+powerspectrum_cache = {}
+
+# Guards `powerspectrum_cache` when power spectra are computed in worker threads
+powerspectrum_cache_lock = threading.Lock()
+
+# Frequency arrays shared by power spectra with the same grid, keyed by (dt, number of
+# frequencies); an entry disappears once no power spectrum uses it
+frequency_grids = weakref.WeakValueDictionary()
+
+# Upper bound on the threads computing power spectra for combined plots
+MAX_POWERSPECTRUM_WORKERS = 8
+
+
+def powerspectrum_to_dataframe(ps):
+    """
+    Build a Frequency/Power DataFrame backed by one stacked 2-column array, so pandas
+    does not copy each column into its own block.
+    """
+    return pd.DataFrame(
+        np.column_stack([ps.freq, ps.power]),
+        columns=["Frequency", "Power"],
+        copy=False,
+    )
+
+
+def create_powerspectrum_curve(freq, power, label):
+    """
+    Create a Frequency/Power curve backed by plain arrays, with the power downcast
+    to float32 to halve the bytes sent to the browser.
+
+    Frequencies stay float64, since float32 cannot resolve the bin spacing of long
+    observations at high frequencies.
+    """
+    return hv.Curve(
+        {
+            "Frequency": np.asarray(freq),
+            "Power": np.ascontiguousarray(power, dtype=np.float32),
+        },
+        "Frequency",
+        "Power",
+        label=label,
+        datatype=["dictionary"],
+    ).opts(shared_axes=False, tools=["hover"])
+
+
+def cached_powerspectrum(event_list_name, dt, norm):
+    """
+    Return the cached power spectrum of a loaded event list for this dt and norm, or
+    None if there is none or the event list was reloaded since it was computed.
+    """
+    event_list = loaded_event_data[event_list_name]
+    key = (event_list_name, dt, norm)
+    with powerspectrum_cache_lock:
+        cached = powerspectrum_cache.pop(key, None)
+        if cached is not None and cached[0]() is event_list:
+            powerspectrum_cache[key] = cached
+            return cached[1]
+    return None
+
+
+def store_powerspectrum(event_list_name, event_list, dt, norm, ps):
+    """
+    Add a power spectrum to `powerspectrum_cache`, evicting the least recently used
+    entries beyond `POWERSPECTRUM_CACHE_SIZE`, and return it.
+    """
+    key = (event_list_name, dt, norm)
+    with powerspectrum_cache_lock:
+        # Reuse an identical frequency grid so spectra of the same shape share memory
+        grid_key = (dt, len(ps.freq))
+        shared_freq = frequency_grids.get(grid_key)
+        if shared_freq is not None and np.array_equal(shared_freq, ps.freq):
+            ps.freq = shared_freq
+        else:
+            frequency_grids[grid_key] = ps.freq
+        powerspectrum_cache[key] = (weakref.ref(event_list), ps)
+        while len(powerspectrum_cache) > POWERSPECTRUM_CACHE_SIZE:
+            del powerspectrum_cache[next(iter(powerspectrum_cache))]
+    return ps
+
+
+def compute_powerspectrum(event_list_name, dt, norm):
+    """
+    Return the power spectrum of a loaded event list, reusing the last result for
+    the same event list, dt and norm.
+
+    Entries hold a weak reference to the event list they were computed from, so an
+    event list that is reloaded under the same name is recomputed.
+    """
+    ps = cached_powerspectrum(event_list_name, dt, norm)
+    if ps is not None:
+        return ps
+
+    event_list = loaded_event_data[event_list_name]
+    # set_workers only applies to the calling thread, so it is set here rather than at import
+    with scipy_fft.set_workers(-1):
+        ps = Powerspectrum.from_events(events=event_list, dt=dt, norm=norm)
+    return store_powerspectrum(event_list_name, event_list, dt, norm, ps)
+
+
+def compute_powerspectra(event_list_names, dt, norm):
+    """
+    Return the power spectra of several loaded event lists, in order.
+
+    Cached spectra are reused. The rest are binned in one batch when numba is
+    installed and their event lists share a single GTI, and otherwise computed one
+    by one in parallel threads (the FFTs release the GIL). Either way the new
+    spectra are added to the cache.
+    """
+    spectra = {name: cached_powerspectrum(name, dt, norm) for name in event_list_names}
+    missing = [name for name, ps in spectra.items() if ps is None]
+
+    if len(missing) > 1:
+        event_lists = [loaded_event_data[name] for name in missing]
+        batch = batch_powerspectra(event_lists, dt, norm)
+        if batch is not None:
+            for name, event_list, ps in zip(missing, event_lists, batch):
+                spectra[name] = store_powerspectrum(name, event_list, dt, norm, ps)
+            missing = []
+
+    if missing:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_POWERSPECTRUM_WORKERS, len(missing))
+        ) as executor:
+            for name, ps in zip(
+                missing,
+                executor.map(lambda name: compute_powerspectrum(name, dt, norm), missing),
+            ):
+                spectra[name] = ps
+    return [spectra[name] for name in event_list_names]
+
 # Create a warning handler
 def create_warning_handler():
     warning_handler = WarningHandler()
@@ -83,9 +229,12 @@ def create_powerspectrum_tab(
     header_container,
     float_panel_container,
 ):
+    # Both selectors offer the same names, so list them once
+    event_list_names = list(loaded_event_data)
+
     event_list_dropdown = pn.widgets.Select(
         name="Select Event List(s)",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=event_list_names,
     )
 
     dt_input = pn.widgets.FloatInput(
@@ -104,7 +253,7 @@ def create_powerspectrum_tab(
 
     multi_event_select = pn.widgets.MultiSelect(
         name="Or Select Event List(s) to Combine",
-        options={name: i for i, (name, event) in enumerate(loaded_event_data)},
+        options=event_list_names,
         size=8,
     )
 
@@ -138,10 +287,10 @@ def create_powerspectrum_tab(
     )
 
     def update_time_info(event):
-        selected_index = event_list_dropdown.value
-        if selected_index is not None:
-            event_list_name = loaded_event_data[selected_index][0]
-            event_list = loaded_event_data[selected_index][1]
+        selected_name = event_list_dropdown.value
+        if selected_name is not None:
+            event_list_name = selected_name
+            event_list = loaded_event_data[selected_name]
             start_time = event_list.time[0]
             end_time = event_list.time[-1]
             time_info_pane.object = (
@@ -156,8 +305,8 @@ def create_powerspectrum_tab(
     def create_holoviews_panes(plot):
         return pn.pane.HoloViews(plot, width=600, height=600, linked_axes=False)
 
-    def create_holoviews_plots(df, label, dt, norm, color_key=None):
-        plot = df.hvplot(x="Frequency", y="Power", shared_axes=False, label=label)
+    def create_holoviews_plots(ps, label, dt, norm, color_key=None):
+        plot = create_powerspectrum_curve(ps.freq, ps.power, label)
 
         if color_key:
             if rasterize_checkbox.value:
@@ -175,7 +324,7 @@ def create_powerspectrum_tab(
                     colorbar=True,
                 )
             else:
-                return plot
+                return downsample1d(plot, algorithm="lttb", max_samples=MAX_PLOT_SAMPLES)
         else:
             if rasterize_checkbox.value:
                 return hd.rasterize(
@@ -191,10 +340,10 @@ def create_powerspectrum_tab(
                     colorbar=True,
                 )
             else:
-                return plot
+                return downsample1d(plot, algorithm="lttb", max_samples=MAX_PLOT_SAMPLES)
 
-    def create_holoviews_plots_no_colorbar(df, label, dt, norm, color_key=None):
-        plot = df.hvplot(x="Frequency", y="Power", shared_axes=False, label=label)
+    def create_holoviews_plots_no_colorbar(ps, label, dt, norm, color_key=None):
+        plot = create_powerspectrum_curve(ps.freq, ps.power, label)
 
         if color_key:
             if rasterize_checkbox.value:
@@ -212,7 +361,7 @@ def create_powerspectrum_tab(
                     colorbar=False,
                 )
             else:
-                return plot
+                return downsample1d(plot, algorithm="lttb", max_samples=MAX_PLOT_SAMPLES)
         else:
             if rasterize_checkbox.value:
                 return hd.rasterize(
@@ -228,14 +377,14 @@ def create_powerspectrum_tab(
                     cmap="Viridis",
                 )
             else:
-                return plot
+                return downsample1d(plot, algorithm="lttb", max_samples=MAX_PLOT_SAMPLES)
 
-    def create_rebinned_holoviews_plots(df, label, dt, norm, color_key=None, log_binned=False):
+    def create_rebinned_holoviews_plots(ps, label, dt, norm, color_key=None, log_binned=False):
         """
         Create a HoloViews plot for rebinned power spectrum data.
         
         Parameters:
-            df (pd.DataFrame): DataFrame containing rebinned frequency and power values.
+            ps (Powerspectrum): The rebinned power spectrum.
             label (str): Label for the plot.
             dt (float): Time binning parameter.
             norm (str): Normalization parameter.
@@ -245,8 +394,8 @@ def create_powerspectrum_tab(
         Returns:
             hv.Overlay or hv.DynamicMap: The generated HoloViews plot.
         """
-        # Create the initial plot from the DataFrame
-        plot = df.hvplot(x="Frequency", y="Power", shared_axes=False, label=label)
+        # Create the initial plot from the power spectrum arrays
+        plot = create_powerspectrum_curve(ps.freq, ps.power, label)
 
         # Check if color_key is provided for individual plot colors
         if color_key:
@@ -266,7 +415,9 @@ def create_powerspectrum_tab(
                     logx=log_binned  # Apply log scale only if log_binned is True
                 )
             else:
-                return plot.opts(logx=log_binned)  # Apply log scale only if log_binned is True
+                return downsample1d(
+                    plot, algorithm="lttb", max_samples=MAX_PLOT_SAMPLES
+                ).opts(logx=log_binned)  # Apply log scale only if log_binned is True
         else:
             if rasterize_checkbox.value:
                 return hd.rasterize(
@@ -283,33 +434,33 @@ def create_powerspectrum_tab(
                     logx=log_binned  # Apply log scale only if log_binned is True
                 )
             else:
-                return plot.opts(logx=log_binned)  # Apply log scale only if log_binned is True
+                return downsample1d(
+                    plot, algorithm="lttb", max_samples=MAX_PLOT_SAMPLES
+                ).opts(logx=log_binned)  # Apply log scale only if log_binned is True
 
     
     def create_dataframe_panes(df, title):
         return pn.FlexBox(
             pn.pane.Markdown(f"**{title}**"),
-            pn.pane.DataFrame(df, width=600, height=600),
+            pn.widgets.Tabulator(
+                df,
+                pagination="remote",
+                page_size=DATAFRAME_PAGE_SIZE,
+                disabled=True,
+                width=600,
+                height=600,
+            ),
             align_items="center",
             justify_content="center",
             flex_wrap="nowrap",
             flex_direction="column",
         )
 
-    def create_dataframe(selected_event_list_index, dt, norm):
-        if selected_event_list_index is not None:
-            event_list = loaded_event_data[selected_event_list_index][1]
-
-            # Create a PowerSpectrum object using from_events
-            ps = Powerspectrum.from_events(events=event_list, dt=dt, norm=norm)
-
-            df = pd.DataFrame(
-                {
-                    "Frequency": ps.freq,
-                    "Power": ps.power,
-                }
-            )
-            return df, ps
+    def create_dataframe(selected_event_list_name, dt, norm):
+        if selected_event_list_name is not None:
+            # Create a PowerSpectrum object using from_events, or reuse a cached one
+            ps = compute_powerspectrum(selected_event_list_name, dt, norm)
+            return powerspectrum_to_dataframe(ps), ps
         return None, None
 
     """ Rebin Functionality """
@@ -318,6 +469,9 @@ def create_powerspectrum_tab(
         rebin_size = rebin_size_input.value
         log_binned = False  # Initialize flag for logarithmic rebinning
         if linear_rebin_checkbox.value:
+            # Rebinning to the current resolution is a no-op; skip the copy
+            if abs(rebin_size - ps.df) < 1e-12 * ps.df:
+                return ps
             # Perform linear rebinning
             rebinned_ps = ps.rebin(rebin_size, method="mean")
             return rebinned_ps
@@ -333,15 +487,15 @@ def create_powerspectrum_tab(
     def create_floatpanel_area(content, title):
         return FloatingPlot(content=content, title=title)
 
-    def show_dataframe(event=None):
+    async def show_dataframe(event=None):
         if not loaded_event_data:
             output_box_container[:] = [
                 create_loadingdata_output_box("No loaded event data available.")
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -349,9 +503,12 @@ def create_powerspectrum_tab(
 
         dt = dt_input.value
         norm = norm_select.value
-        df, ps = create_dataframe(selected_event_list_index, dt, norm)
+        # Compute off the event loop so the UI stays responsive during the FFT
+        df, ps = await asyncio.to_thread(
+            create_dataframe, selected_event_list_name, dt, norm
+        )
         if df is not None:
-            event_list_name = loaded_event_data[selected_event_list_index][0]
+            event_list_name = selected_event_list_name
             dataframe_title = f"{event_list_name} (dt={dt}, norm={norm})"
             dataframe_output = create_dataframe_panes(df, dataframe_title)
             if dataframe_checkbox.value:
@@ -368,15 +525,15 @@ def create_powerspectrum_tab(
                 create_loadingdata_output_box("Failed to create dataframe.")
             ]
 
-    def generate_powerspectrum(event=None):
+    async def generate_powerspectrum(event=None):
         if not loaded_event_data:
             output_box_container[:] = [
                 create_loadingdata_output_box("No loaded event data available.")
             ]
             return
 
-        selected_event_list_index = event_list_dropdown.value
-        if selected_event_list_index is None:
+        selected_event_list_name = event_list_dropdown.value
+        if selected_event_list_name is None:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event list selected.")
             ]
@@ -384,14 +541,18 @@ def create_powerspectrum_tab(
 
         dt = dt_input.value
         norm = norm_select.value
-        df, ps = create_dataframe(selected_event_list_index, dt, norm)
+        # Compute off the event loop so the UI stays responsive during the FFT; the
+        # plots use the spectrum's arrays directly, so no DataFrame is built here
+        ps = await asyncio.to_thread(
+            compute_powerspectrum, selected_event_list_name, dt, norm
+        )
         
-        if df is not None:
-            event_list_name = loaded_event_data[selected_event_list_index][0]
+        if ps is not None:
+            event_list_name = selected_event_list_name
             label = f"{event_list_name} (dt={dt}, norm={norm})"
             
             # Create the original plot
-            original_plot_hv = create_holoviews_plots(df, label, dt, norm)
+            original_plot_hv = create_holoviews_plots(ps, label, dt, norm)
 
             # Initialize the holoviews_output variable
             holoviews_output = original_plot_hv
@@ -400,13 +561,8 @@ def create_powerspectrum_tab(
             rebinned_ps = rebin_powerspectrum(ps)
             
             if rebinned_ps is not None:
-                # Create a DataFrame for the rebinned plot
-                rebinned_df = pd.DataFrame({
-                    "Frequency": rebinned_ps.freq,
-                    "Power": rebinned_ps.power,
-                })
                 rebinned_label = f"Rebinned {event_list_name} (dt={dt}, norm={norm})"
-                rebinned_plot_hv = create_rebinned_holoviews_plots(rebinned_df, rebinned_label, dt, norm, log_binned=log_binned)
+                rebinned_plot_hv = create_rebinned_holoviews_plots(rebinned_ps, rebinned_label, dt, norm, log_binned=log_binned)
 
                 # Check if the user wants to plot rebin with the original
                 if rebin_with_original_checkbox.value:
@@ -447,44 +603,51 @@ def create_powerspectrum_tab(
             ]
 
 
-    def combine_selected_plots(event=None):
-        selected_event_list_indices = multi_event_select.value
-        if not selected_event_list_indices:
+    async def combine_selected_plots(event=None):
+        selected_event_list_names = multi_event_select.value
+        if not selected_event_list_names:
             output_box_container[:] = [
                 create_loadingdata_output_box("No event lists selected.")
             ]
             return
 
         combined_plots = []
-        combined_title = []
 
         # Define a color key for distinct colors
         color_key = {
-            index: colors[i % len(colors)]
-            for i, index in enumerate(selected_event_list_indices)
+            name: colors[i % len(colors)]
+            for i, name in enumerate(selected_event_list_names)
         }
 
-        for index in selected_event_list_indices:
-            dt = dt_input.value
-            norm = norm_select.value
-            df, ps = create_dataframe(index, dt, norm)
-            if df is not None:
-                event_list_name = loaded_event_data[index][0]
+        dt = dt_input.value
+        norm = norm_select.value
+
+        # Compute off the event loop and build the plots back on it
+        results = await asyncio.to_thread(
+            compute_powerspectra, selected_event_list_names, dt, norm
+        )
 
-                label = f"{event_list_name} (dt={dt}, norm={norm})"
+        computed = [
+            (name, ps)
+            for name, ps in zip(selected_event_list_names, results)
+            if ps is not None
+        ]
+        combined_title = [name for name, _ in computed]
+
+        if computed:
+            # Spectra on the same grid already share one frequency array through
+            # `frequency_grids`, so their curves reference it rather than copies
+            for name, ps in computed:
+                label = f"{name} (dt={dt}, norm={norm})"
                 plot_hv = create_holoviews_plots_no_colorbar(
-                    df, label, dt, norm, color_key=color_key[index]
+                    ps, label, dt, norm, color_key=color_key[name]
                 )
                 combined_plots.append(plot_hv)
-                combined_title.append(event_list_name)
-
-        if combined_plots:
             combined_plot = (
                 hv.Overlay(combined_plots)
                 .opts(shared_axes=False, legend_position="right", width=600, height=600)
                 .collate()
             )
-
             combined_pane = create_holoviews_panes(combined_plot)
 
             combined_title_str = " + ".join(combined_title)
@@ -0,0 +1,49 @@
+import pytest
+from unittest.mock import MagicMock
+
+from utils.DashboardClasses import WarningHandler
+
+
+@pytest.fixture
+def output_box_container():
+    return []
+
+
+@pytest.fixture
+def warning_box_container():
+    return []
+
+
+@pytest.fixture
+def warning_handler():
+    return WarningHandler()
+
+
+@pytest.fixture
+def mock_file_selector(tmp_path):
+    return MagicMock(value=[str(tmp_path / "events.evt")])
+
+
+@pytest.fixture
+def filename_input():
+    return MagicMock(value="")
+
+
+@pytest.fixture
+def format_input():
+    return MagicMock(value="ogip")
+
+
+@pytest.fixture
+def format_checkbox():
+    return MagicMock(value=False)
+
+
+@pytest.fixture
+def rmf_file_dropper():
+    return MagicMock(value=None)
+
+
+@pytest.fixture
+def additional_columns_input():
+    return MagicMock(value="")
@@ -1,8 +1,17 @@
+import os
+import asyncio
+import warnings
+import weakref
+import h5py
+import numpy as np
 import pytest
+from stingray.events import EventList
 from unittest.mock import MagicMock, patch
+import modules.DataLoading.DataIngestion as dataingestion
+from utils.DashboardClasses import WarningHandler
 from modules.DataLoading.DataIngestion import (
     create_loadingdata_output_box,
-    load_event_data,
+    read_event_data,
     save_loaded_files,
     delete_selected_files,
     preview_loaded_files,
@@ -10,6 +19,15 @@ from modules.DataLoading.DataIngestion import (
     create_event_list,
     simulate_event_list,
     create_warning_handler,
+    capture_warnings,
+    default_event_list_name,
+    _create_compressed_dataset,
+    write_consolidated_event_lists,
+    read_consolidated_event_lists,
+    write_npz_event_list,
+    read_npz_event_list,
+    read_cached_event_list,
+    prune_event_cache,
 )
 
 
@@ -19,18 +37,20 @@ def test_create_loadingdata_output_box():
     assert output_box.output_content == content
 
 
-@patch("dataingestion.loaded_event_data", [])
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {})
 def test_load_event_data_no_file_selected(
-    output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox
+    output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox, rmf_file_dropper, additional_columns_input
 ):
     # Set up file selector with no selection
     mock_file_selector.value = []
-    load_event_data(
+    read_event_data(
         event=None,
         file_selector=mock_file_selector,
         filename_input=filename_input,
         format_input=format_input,
         format_checkbox=format_checkbox,
+        rmf_file_dropper=rmf_file_dropper,
+        additional_columns_input=additional_columns_input,
         output_box_container=output_box_container,
         warning_box_container=warning_box_container,
         warning_handler=warning_handler,
@@ -38,18 +58,20 @@ def test_load_event_data_no_file_selected(
     assert "No file selected" in output_box_container[0].output_content
 
 
-@patch("dataingestion.loaded_event_data", [])
-@patch("dataingestion.EventList.read")
-def test_load_event_data_success(mock_read, output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox):
-    # Mock EventList read to return a valid event
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {})
+@patch("modules.DataLoading.DataIngestion.read_event_file")
+def test_load_event_data_success(mock_read, output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox, rmf_file_dropper, additional_columns_input):
+    # Mock the file reader to return a valid event
     mock_read.return_value = MagicMock()
     
-    load_event_data(
+    read_event_data(
         event=None,
         file_selector=mock_file_selector,
         filename_input=filename_input,
         format_input=format_input,
         format_checkbox=format_checkbox,
+        rmf_file_dropper=rmf_file_dropper,
+        additional_columns_input=additional_columns_input,
         output_box_container=output_box_container,
         warning_box_container=warning_box_container,
         warning_handler=warning_handler,
@@ -58,18 +80,20 @@ def test_load_event_data_success(mock_read, output_box_container, warning_box_co
     assert "loaded successfully" in output_box_container[0].output_content
 
 
-@patch("dataingestion.loaded_event_data", [("file1", MagicMock())])
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {"file1": MagicMock()})
 def test_load_event_data_duplicate_file(
-    output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox
+    output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox, rmf_file_dropper, additional_columns_input
 ):
     # Test with duplicate file name
     filename_input.value = "file1"
-    load_event_data(
+    read_event_data(
         event=None,
         file_selector=mock_file_selector,
         filename_input=filename_input,
         format_input=format_input,
         format_checkbox=format_checkbox,
+        rmf_file_dropper=rmf_file_dropper,
+        additional_columns_input=additional_columns_input,
         output_box_container=output_box_container,
         warning_box_container=warning_box_container,
         warning_handler=warning_handler,
@@ -77,9 +101,9 @@ def test_load_event_data_duplicate_file(
     assert "already exists in memory" in output_box_container[0].output_content
 
 
-@patch("dataingestion.os.path.exists", return_value=False)
-@patch("dataingestion.loaded_event_data", [("file1", MagicMock())])
-def test_save_loaded_files_success(mock_exists, output_box_container, warning_box_container, warning_handler, filename_input, format_input, format_checkbox):
+@patch("modules.DataLoading.DataIngestion.os.listdir", return_value=[])
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {"file1": MagicMock()})
+def test_save_loaded_files_success(mock_listdir, output_box_container, warning_box_container, warning_handler, filename_input, format_input, format_checkbox):
     save_loaded_files(
         event=None,
         filename_input=filename_input,
@@ -92,9 +116,9 @@ def test_save_loaded_files_success(mock_exists, output_box_container, warning_bo
     assert "saved successfully" in output_box_container[0].output_content
 
 
-@patch("dataingestion.os.path.exists", return_value=True)
-@patch("dataingestion.loaded_event_data", [("file1", MagicMock())])
-def test_save_loaded_files_duplicate_name(mock_exists, output_box_container, warning_box_container, warning_handler, filename_input, format_input, format_checkbox):
+@patch("modules.DataLoading.DataIngestion.os.listdir", return_value=["file1.ogip"])
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {"file1": MagicMock()})
+def test_save_loaded_files_duplicate_name(mock_listdir, output_box_container, warning_box_container, warning_handler, filename_input, format_input, format_checkbox):
     save_loaded_files(
         event=None,
         filename_input=filename_input,
@@ -107,7 +131,7 @@ def test_save_loaded_files_duplicate_name(mock_exists, output_box_container, war
     assert "already exists" in output_box_container[0].output_content
 
 
-@patch("dataingestion.os.remove")
+@patch("modules.DataLoading.DataIngestion.os.remove")
 def test_delete_selected_files_success(mock_remove, output_box_container, warning_box_container, warning_handler, mock_file_selector):
     delete_selected_files(
         event=None,
@@ -119,6 +143,8 @@ def test_delete_selected_files_success(mock_remove, output_box_container, warnin
     assert "deleted successfully" in output_box_container[0].output_content
 
 
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {})
+@patch("modules.DataLoading.DataIngestion.loaded_light_curve", [])
 def test_preview_loaded_files_no_data(output_box_container, warning_box_container, warning_handler):
     preview_loaded_files(
         event=None,
@@ -129,7 +155,7 @@ def test_preview_loaded_files_no_data(output_box_container, warning_box_containe
     assert "No valid files or light curves loaded" in output_box_container[0].output_content
 
 
-@patch("dataingestion.loaded_event_data", [("event1", MagicMock(time=[0.1, 0.2], mjdref=58000, gti=[[0, 1]]) )])
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {"event1": MagicMock(time=[0.1, 0.2], mjdref=58000, gti=[[0, 1]]) })
 def test_preview_loaded_files_with_data(output_box_container, warning_box_container, warning_handler):
     preview_loaded_files(
         event=None,
@@ -140,7 +166,7 @@ def test_preview_loaded_files_with_data(output_box_container, warning_box_contai
     assert "Event List - event1" in output_box_container[0].output_content
 
 
-@patch("dataingestion.loaded_event_data", [("event1", MagicMock())])
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {"event1": MagicMock()})
 def test_clear_loaded_files(output_box_container, warning_box_container):
     clear_loaded_files(
         event=None,
@@ -158,19 +184,31 @@ def test_create_event_list_missing_data(output_box_container, warning_box_contai
         pi_input=MagicMock(value=""),
         gti_input=MagicMock(value=""),
         mjdref_input=MagicMock(value=""),
+        dt_input=MagicMock(value=""),
+        high_precision_checkbox=MagicMock(value=False),
+        mission_input=MagicMock(value=""),
+        instr_input=MagicMock(value=""),
+        detector_id_input=MagicMock(value=""),
+        header_input=MagicMock(value=""),
+        timeref_input=MagicMock(value=""),
+        timesys_input=MagicMock(value=""),
+        ephem_input=MagicMock(value=""),
+        skip_checks_checkbox=MagicMock(value=False),
+        notes_input=MagicMock(value=""),
         name_input=MagicMock(value=""),
         output_box_container=output_box_container,
         warning_box_container=warning_box_container,
         warning_handler=warning_handler,
     )
-    assert "Please enter Photon Arrival Times and MJDREF" in output_box_container[0].output_content
+    assert "Photon Arrival Times is a mandatory field" in output_box_container[0].output_content
 
 
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {})
 def test_simulate_event_list(output_box_container, warning_box_container, warning_handler):
     simulate_event_list(
         event=None,
-        time_slider=MagicMock(value=10),
-        count_slider=MagicMock(value=5),
+        time_bins_input=MagicMock(value=10),
+        max_counts_input=MagicMock(value=5),
         dt_input=MagicMock(value=0.1),
         name_input=MagicMock(value="simulated_event"),
         method_selector=MagicMock(value="Standard Method"),
@@ -181,9 +219,249 @@ def test_simulate_event_list(output_box_container, warning_box_container, warnin
     assert "simulated successfully" in output_box_container[0].output_content
 
 
-def test_create_warning_handler():
+def test_create_warning_handler(monkeypatch):
+    # create_warning_handler replaces the global hook; restore it after the test
+    monkeypatch.setattr(warnings, "showwarning", warnings.showwarning)
     handler = create_warning_handler()
-    with pytest.warns(None) as record:
-        handler.warn("Test warning", category=UserWarning)
-    assert len(record) == 1
-    assert record[0].message.args[0] == "Test warning"
+    assert warnings.showwarning == handler.warn
+    handler.warn("Test warning", category=UserWarning)
+    assert len(handler.warnings) == 1
+    assert handler.warnings[0][0] == "Test warning"
+    assert handler.warnings[0][1] is UserWarning
+
+
+def test_capture_warnings_keeps_concurrent_operations_apart(monkeypatch):
+    monkeypatch.setattr(warnings, "showwarning", warnings.showwarning)
+    first, second = WarningHandler(), WarningHandler()
+    started = asyncio.Event()
+
+    async def operation(handler, message, wait_for_other):
+        with capture_warnings(handler):
+            if wait_for_other:
+                await started.wait()
+            else:
+                started.set()
+            await asyncio.to_thread(warnings.warn, message)
+
+    async def run_both():
+        await asyncio.gather(
+            operation(first, "first", True), operation(second, "second", False)
+        )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        asyncio.run(run_both())
+    assert [str(w[0]) for w in first.warnings] == ["first"]
+    assert [str(w[0]) for w in second.warnings] == ["second"]
+
+
+@pytest.mark.parametrize(
+    "file_path, expected",
+    [
+        ("/data/ni1200120106.evt.gz", "ni1200120106"),
+        ("/data/monol_testA.evt", "monol_testA"),
+        ("a.hdf5", "a"),
+        ("events.fits.bz2", "events"),
+        ("run.v2.evt", "run.v2"),
+    ],
+)
+def test_default_event_list_name(file_path, expected):
+    assert default_event_list_name(file_path) == expected
+
+
+@pytest.mark.parametrize("shape", [(0,), (0, 2), (5,), (3, 2)])
+def test_create_compressed_dataset_round_trip(tmp_path, shape):
+    values = np.arange(int(np.prod(shape)), dtype=np.float64).reshape(shape)
+    with h5py.File(tmp_path / "data.h5", "w") as h5_file:
+        _create_compressed_dataset(h5_file, "values", values)
+    with h5py.File(tmp_path / "data.h5", "r") as h5_file:
+        np.testing.assert_array_equal(h5_file["values"][()], values)
+
+
+def test_consolidated_file_accepts_repeated_saves(tmp_path):
+    save_path = str(tmp_path / "loaded_events.h5")
+    first = EventList(time=[0.5, 1.5, 2.5], gti=[[0, 3]], mjdref=58000)
+    second = EventList(time=[10.5, 11.5], gti=[[10, 12]], mjdref=58001)
+
+    write_consolidated_event_lists(save_path, [("first", first)])
+    write_consolidated_event_lists(save_path, [("second", second)])
+
+    restored = dict(read_consolidated_event_lists(save_path))
+    assert list(restored) == ["first", "second"]
+    np.testing.assert_array_equal(restored["first"].time, first.time)
+    np.testing.assert_array_equal(restored["second"].time, second.time)
+    assert restored["second"].mjdref == second.mjdref
+
+    with pytest.raises(FileExistsError):
+        write_consolidated_event_lists(save_path, [("first", first)])
+
+
+def test_consolidated_file_round_trips_event_list_attributes(tmp_path):
+    save_path = str(tmp_path / "loaded_events.h5")
+    event_list = EventList(
+        time=[0.5, 1.5, 2.5, 3.5],
+        energy=[1.0, 2.0, 3.0, 4.0],
+        pi=[10, 20, 30, 40],
+        gti=[[0, 2], [3, 4]],
+        mjdref=58000.5,
+        dt=0.1,
+        mission="nustar",
+        instr="fpma",
+        detector_id=[0, 1, 2, 3],
+        timeref="solarsystem",
+        timesys="tdb",
+        notes="consolidated round trip",
+    )
+
+    write_consolidated_event_lists(save_path, [("events", event_list)])
+    (name, restored), = read_consolidated_event_lists(save_path)
+
+    assert name == "events"
+    for attr in ("time", "energy", "pi", "gti", "detector_id"):
+        np.testing.assert_array_equal(getattr(restored, attr), getattr(event_list, attr))
+    for attr in ("mjdref", "dt", "mission", "instr", "timeref", "timesys", "notes"):
+        assert getattr(restored, attr) == getattr(event_list, attr)
+
+
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {})
+def test_load_consolidated_file_uses_saved_names(
+    tmp_path, output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox, rmf_file_dropper, additional_columns_input
+):
+    save_path = str(tmp_path / "loaded_events.h5")
+    write_consolidated_event_lists(save_path, [("saved", EventList(time=[0.5, 1.5]))])
+    mock_file_selector.value = [save_path]
+    format_input.value = "hdf5"
+
+    read_event_data(
+        event=None,
+        file_selector=mock_file_selector,
+        filename_input=filename_input,
+        format_input=format_input,
+        format_checkbox=format_checkbox,
+        rmf_file_dropper=rmf_file_dropper,
+        additional_columns_input=additional_columns_input,
+        output_box_container=output_box_container,
+        warning_box_container=warning_box_container,
+        warning_handler=warning_handler,
+    )
+    assert list(dataingestion.loaded_event_data) == ["saved"]
+
+
+@patch("modules.DataLoading.DataIngestion.loaded_event_data", {})
+def test_load_consolidated_file_rejects_entered_name(
+    tmp_path, output_box_container, warning_box_container, warning_handler, mock_file_selector, filename_input, format_input, format_checkbox, rmf_file_dropper, additional_columns_input
+):
+    save_path = str(tmp_path / "loaded_events.h5")
+    write_consolidated_event_lists(save_path, [("saved", EventList(time=[0.5, 1.5]))])
+    mock_file_selector.value = [save_path]
+    filename_input.value = "renamed"
+    format_input.value = "hdf5"
+
+    read_event_data(
+        event=None,
+        file_selector=mock_file_selector,
+        filename_input=filename_input,
+        format_input=format_input,
+        format_checkbox=format_checkbox,
+        rmf_file_dropper=rmf_file_dropper,
+        additional_columns_input=additional_columns_input,
+        output_box_container=output_box_container,
+        warning_box_container=warning_box_container,
+        warning_handler=warning_handler,
+    )
+    assert "Please do not enter a name" in output_box_container[0].output_content
+    assert not dataingestion.loaded_event_data
+
+
+def test_npz_round_trips_event_list_attributes(tmp_path):
+    save_path = str(tmp_path / "events.npz")
+    event_list = EventList(
+        time=[0.5, 1.5, 2.5],
+        energy=[1.0, 2.0, 3.0],
+        pi=[10, 20, 30],
+        gti=[[0, 3]],
+        mjdref=58000.5,
+        dt=0.1,
+        mission="nicer",
+        instr="xti",
+        detector_id=[4, 5, 6],
+    )
+
+    write_npz_event_list(save_path, event_list)
+    restored = read_npz_event_list(save_path)
+
+    for attr in ("time", "energy", "pi", "gti", "detector_id"):
+        np.testing.assert_array_equal(getattr(restored, attr), getattr(event_list, attr))
+    for attr in ("mjdref", "dt", "mission", "instr"):
+        assert getattr(restored, attr) == getattr(event_list, attr)
+
+    with pytest.raises(FileExistsError):
+        write_npz_event_list(save_path, event_list)
+
+
+@pytest.fixture
+def counted_event_reads(tmp_path, monkeypatch):
+    """Send the event cache to a temporary directory and count EventList.read calls."""
+    monkeypatch.setattr(dataingestion, "event_cache_path", str(tmp_path / "cache"))
+    monkeypatch.setattr(dataingestion, "parsed_event_lists", weakref.WeakValueDictionary())
+    calls = []
+
+    def fake_read(file_path, fmt=None, **kwargs):
+        calls.append(file_path)
+        return EventList(time=[1.0, 2.0], gti=[[0, 3]])
+
+    monkeypatch.setattr(EventList, "read", staticmethod(fake_read))
+    source = tmp_path / "events.evt"
+    source.write_bytes(b"events")
+    return str(source), calls
+
+
+def test_read_cached_event_list_reuses_pickle(counted_event_reads):
+    source, calls = counted_event_reads
+    first = read_cached_event_list(source, "ogip")
+    # Forget the in-process copy so the second read must come from the pickle
+    dataingestion.parsed_event_lists.clear()
+    second = read_cached_event_list(source, "ogip")
+
+    assert len(calls) == 1
+    np.testing.assert_array_equal(second.time, first.time)
+    cache_dir = dataingestion.event_cache_path
+    assert not [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+
+def test_read_cached_event_list_rereads_unreadable_pickle(counted_event_reads):
+    source, calls = counted_event_reads
+    read_cached_event_list(source, "ogip")
+    cache_dir = dataingestion.event_cache_path
+    (pickle_name,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, pickle_name), "wb") as f:
+        f.write(b"not a pickle")
+
+    dataingestion.parsed_event_lists.clear()
+    event_list = read_cached_event_list(source, "ogip")
+
+    assert len(calls) == 2
+    np.testing.assert_array_equal(event_list.time, [1.0, 2.0])
+
+
+def test_prune_event_cache_evicts_oldest(tmp_path, monkeypatch):
+    monkeypatch.setattr(dataingestion, "event_cache_path", str(tmp_path))
+    for age, name in enumerate(["new", "old"]):
+        path = tmp_path / f"{name}.pkl"
+        path.write_bytes(b"x" * 10)
+        os.utime(path, (1000 - age * 100, 1000 - age * 100))
+
+    prune_event_cache(max_bytes=10)
+
+    assert sorted(os.listdir(tmp_path)) == ["new.pkl"]
+
+
+def test_read_cached_event_list_does_not_alias_loaded_copies(counted_event_reads):
+    source, calls = counted_event_reads
+    first = read_cached_event_list(source, "ogip")
+    second = read_cached_event_list(source, "ogip")
+
+    assert len(calls) == 1
+    assert second is not first
+    second.time += 10
+    np.testing.assert_array_equal(first.time, [1.0, 2.0])
@@ -0,0 +1,49 @@
+import os
+
+import numpy as np
+import pytest
+from stingray import Lightcurve
+
+import modules.QuickLook.LightCurve as lightcurve
+from modules.QuickLook.LightCurve import spill_lightcurve
+
+
+@pytest.fixture
+def spill_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(lightcurve, "LIGHTCURVE_SPILL_BYTES", 0)
+    monkeypatch.setattr(lightcurve, "LIGHTCURVE_SPILL_ROOT", str(tmp_path))
+    monkeypatch.setattr(lightcurve, "lightcurve_spill_path", str(tmp_path / "1"))
+    monkeypatch.setattr(lightcurve, "_spill_dir_prepared", False)
+    return tmp_path / "1"
+
+
+@pytest.mark.parametrize("err_dist", ["poisson", "gauss"])
+def test_spilled_lightcurve_matches_original(spill_dir, err_dist):
+    rng = np.random.default_rng(0)
+    lc = Lightcurve(
+        np.arange(1000) + 0.5,
+        rng.poisson(20, 1000).astype(float),
+        err=np.full(1000, 3.0) if err_dist == "gauss" else None,
+        err_dist=err_dist,
+        dt=1.0,
+        mjdref=58000.0,
+    )
+
+    spilled = spill_lightcurve(lc)
+
+    assert isinstance(spilled.counts, np.memmap)
+    np.testing.assert_array_equal(spilled.time, lc.time)
+    np.testing.assert_array_equal(spilled.counts, lc.counts)
+    np.testing.assert_allclose(spilled.countrate, lc.countrate)
+    np.testing.assert_allclose(spilled.counts_err, lc.counts_err)
+    np.testing.assert_array_equal(spilled.gti, lc.gti)
+    assert spilled.mjdref == lc.mjdref
+    assert len(os.listdir(spill_dir)) == 2
+
+
+def test_small_lightcurve_is_not_spilled(spill_dir, monkeypatch):
+    monkeypatch.setattr(lightcurve, "LIGHTCURVE_SPILL_BYTES", 1 << 30)
+    lc = Lightcurve(np.arange(10) + 0.5, np.ones(10), dt=1.0)
+
+    assert spill_lightcurve(lc) is lc
+    assert not spill_dir.exists()
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from stingray import Powerspectrum
+from stingray.events import EventList
+
+import modules.QuickLook.PowerSpectrum as powerspectrum
+
+
+@pytest.fixture
+def loaded_event_lists(monkeypatch):
+    rng = np.random.default_rng(0)
+    events = {
+        name: EventList(
+            time=np.sort(rng.uniform(0.0, 100.0, 2000)), gti=np.array([[0.0, 100.0]])
+        )
+        for name in ("a", "b")
+    }
+    monkeypatch.setattr(powerspectrum, "loaded_event_data", events)
+    monkeypatch.setattr(powerspectrum, "powerspectrum_cache", {})
+    return events
+
+
+def test_compute_powerspectrum_reuses_cached_result(loaded_event_lists):
+    first = powerspectrum.compute_powerspectrum("a", 0.1, "leahy")
+    assert powerspectrum.compute_powerspectrum("a", 0.1, "leahy") is first
+
+
+def test_compute_powerspectrum_recomputes_reloaded_event_list(loaded_event_lists):
+    first = powerspectrum.compute_powerspectrum("a", 0.1, "leahy")
+    loaded_event_lists["a"] = EventList(
+        time=np.sort(np.random.default_rng(1).uniform(0.0, 100.0, 2000)),
+        gti=np.array([[0.0, 100.0]]),
+    )
+    assert powerspectrum.compute_powerspectrum("a", 0.1, "leahy") is not first
+
+
+def test_compute_powerspectra_caches_batched_results(loaded_event_lists):
+    spectra = powerspectrum.compute_powerspectra(["a", "b"], 0.1, "leahy")
+
+    assert all(isinstance(ps, Powerspectrum) for ps in spectra)
+    assert spectra[0].freq is spectra[1].freq
+    for name, ps in zip(["a", "b"], spectra):
+        assert powerspectrum.compute_powerspectrum(name, 0.1, "leahy") is ps
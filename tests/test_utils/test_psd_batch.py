@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from stingray import Powerspectrum
+from stingray.events import EventList
+
+import utils.psd_batch as psd_batch
+from utils.psd_batch import HAS_NUMBA, batch_powerspectra, batch_time_grid
+
+requires_numba = pytest.mark.skipif(not HAS_NUMBA, reason="numba is not installed")
+
+
+def make_event_list(seed, gti=((0.0, 100.0),), n_events=5000):
+    rng = np.random.default_rng(seed)
+    gti = None if gti is None else np.asarray(gti)
+    tstart, tstop = (0.0, 100.0) if gti is None else (gti.min(), gti.max())
+    times = np.sort(rng.uniform(tstart, tstop, n_events))
+    # Events on the GTI edges, and on a bin edge, must be binned like from_events
+    times = np.sort(np.concatenate([times, [tstart, tstart + 0.5, tstop]]))
+    return EventList(time=times, gti=gti)
+
+
+def assert_same_public_attributes(actual, expected):
+    names = {name for name in vars(expected) if not name.startswith("_")}
+    assert names == {name for name in vars(actual) if not name.startswith("_")}
+    for name in names:
+        value, expected_value = getattr(actual, name), getattr(expected, name)
+        if isinstance(expected_value, np.ndarray):
+            assert np.allclose(value, expected_value), name
+        elif isinstance(expected_value, float):
+            assert value == pytest.approx(expected_value), name
+        else:
+            assert value == expected_value, name
+
+
+@requires_numba
+@pytest.mark.parametrize("norm", ["leahy", "frac", "abs", "none"])
+def test_batch_powerspectra_matches_from_events(norm):
+    event_lists = [make_event_list(seed) for seed in range(3)]
+    spectra = batch_powerspectra(event_lists, 0.1, norm)
+
+    assert spectra is not None
+    for ev, ps in zip(event_lists, spectra):
+        expected = Powerspectrum.from_events(ev, dt=0.1, norm=norm)
+        assert isinstance(ps, Powerspectrum)
+        assert_same_public_attributes(ps, expected)
+
+
+@requires_numba
+def test_batch_powerspectra_rebin_matches_from_events():
+    event_lists = [make_event_list(seed) for seed in range(2)]
+    spectra = batch_powerspectra(event_lists, 0.1, "leahy")
+
+    for ev, ps in zip(event_lists, spectra):
+        expected = Powerspectrum.from_events(ev, dt=0.1, norm="leahy").rebin(0.5)
+        rebinned = ps.rebin(0.5)
+        assert np.allclose(rebinned.freq, expected.freq)
+        assert np.allclose(rebinned.power, expected.power)
+
+
+@pytest.mark.parametrize(
+    "gtis",
+    [
+        [((0.0, 100.0),), ((0.0, 90.0),)],
+        [((0.0, 40.0), (60.0, 100.0)), ((0.0, 40.0), (60.0, 100.0))],
+        [None, ((0.0, 100.0),)],
+    ],
+    ids=["different", "gaps", "missing"],
+)
+def test_batch_falls_back_without_a_single_shared_gti(gtis):
+    event_lists = [make_event_list(seed, gti) for seed, gti in enumerate(gtis)]
+    for ev, gti in zip(event_lists, gtis):
+        if gti is None:
+            # EventList may fill in a GTI from the event times; drop it explicitly
+            ev.gti = None
+
+    assert batch_time_grid(event_lists, 0.1) is None
+    assert batch_powerspectra(event_lists, 0.1, "leahy") is None
+
+
+def test_batch_falls_back_without_numba(monkeypatch):
+    monkeypatch.setattr(psd_batch, "HAS_NUMBA", False)
+    event_lists = [make_event_list(seed) for seed in range(2)]
+    assert batch_powerspectra(event_lists, 0.1, "leahy") is None
@@ -1,5 +1,6 @@
 import panel as pn
 import param
+from collections import deque
 from typing import List, Tuple
 
 pn.extension("floatpanel")
@@ -249,7 +250,8 @@ class MainArea(pn.viewable.Viewer):
     MainArea class represents the main content area of the dashboard, containing multiple tabs.
     """
 
-    # Parameter for the content of the tabs, as a dictionary with tab names as keys and content as values
+    # Parameter for the content of the tabs, as a dictionary with tab names as keys and content
+    # (or a callable returning the content) as values
     tabs_content: dict = param.Dict(
         default={},
         doc="Dictionary with tab names as keys and content as values",
@@ -268,6 +270,11 @@ class MainArea(pn.viewable.Viewer):
         """
         tabs = pn.Tabs(dynamic=True)
         for tab_name, content in self.tabs_content.items():
+            # Tab factories are only called when their tab is first rendered
+            if callable(content) and not isinstance(
+                content, (pn.viewable.Viewable, pn.viewable.Viewer)
+            ):
+                content = pn.param.ParamFunction(content, lazy=True)
             tabs.append((tab_name, content))
 
         flexbox_layout = pn.FlexBox(
@@ -510,16 +517,25 @@ class Footer(pn.viewable.Viewer):
 
 
 
+# Most recent warnings kept by a WarningHandler; older ones are dropped
+MAX_WARNINGS = 1024
+
+
 # Custom warning handler
 class WarningHandler:
     def __init__(self):
-        self.warnings = []
+        self.warnings = deque(maxlen=MAX_WARNINGS)
 
     def warn(
         self, message, category=None, filename=None, lineno=None, file=None, line=None
     ):
-        warning_message = f"Message: {message}\nCategory: {category.__name__ if category else 'N/A'}\nFile: {filename if filename else 'N/A'}\nLine: {lineno if lineno else 'N/A'}\n"
-        self.warnings.append(warning_message)
+        self.warnings.append((message, category, filename, lineno))
+
+    def format_all(self):
+        return "\n".join(
+            f"Message: {message}\nCategory: {category.__name__ if category else 'N/A'}\nFile: {filename if filename else 'N/A'}\nLine: {lineno if lineno else 'N/A'}\n"
+            for message, category, filename, lineno in self.warnings
+        )
 
 
 class FloatingPlot(pn.viewable.Viewer):
@@ -1,4 +1,4 @@
-# Global variable to store loaded event data
-loaded_event_data = []
+# Global variable to store loaded event data, keyed by name
+loaded_event_data = {}
 loaded_light_curve = []
 loaded_timeseries_data = []
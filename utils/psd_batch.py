@@ -0,0 +1,133 @@
+import numpy as np
+from stingray import Lightcurve, Powerspectrum
+
+# Numba is optional; without it `batch_powerspectra` returns None, since a plain Python
+# loop over every photon is far slower than computing each power spectrum on its own
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+    prange = range
+
+
+@njit(parallel=True)
+def bin_events_batch(times, offsets, tstart, scale, n_bin):
+    """
+    Histogram several event lists onto the same time grid, one row per event list.
+
+    Bins are computed as `int((time - tstart) * scale)`, the same expression stingray's
+    histogram uses, so events on a bin edge land in the same bin as in
+    `Powerspectrum.from_events`. Events at or after the end of the grid are dropped,
+    as they are there.
+
+    Args:
+        times (numpy.ndarray): The event times of every event list, concatenated.
+        offsets (numpy.ndarray): Start index of each event list in `times`, followed by `len(times)`.
+        tstart (float): The start of the time grid.
+        scale (float): The number of bins per unit time, `n_bin / (tstop - tstart)`.
+        n_bin (int): The number of bins in the time grid.
+
+    Returns:
+        numpy.ndarray: The counts, with shape (number of event lists, n_bin).
+    """
+    n_lists = len(offsets) - 1
+    counts = np.zeros((n_lists, n_bin))
+    for row in prange(n_lists):
+        for i in range(offsets[row], offsets[row + 1]):
+            offset = (times[i] - tstart) * scale
+            if 0 <= offset < n_bin:
+                counts[row, int(offset)] += 1
+    return counts
+
+
+def batch_time_grid(event_lists, dt):
+    """
+    Return the time grid shared by event lists that all have the same single GTI.
+
+    The grid follows `Powerspectrum.from_events`: the GTI is a single segment and `dt`
+    is adjusted so an integer number of bins fits in it. Event lists without GTIs, with
+    more than one GTI, or with differing GTIs are left to `Powerspectrum.from_events`,
+    which handles gaps and missing GTIs itself.
+
+    Args:
+        event_lists (list): The EventLists to bin.
+        dt (float): The requested bin width.
+
+    Returns:
+        tuple or None: (gti, dt, n_bin), or None if the event lists cannot share a grid.
+    """
+    if any(ev.gti is None for ev in event_lists):
+        return None
+    gti = np.asarray(event_lists[0].gti, dtype=np.float64)
+    if gti.shape != (1, 2):
+        return None
+    for ev in event_lists[1:]:
+        if not np.array_equal(np.asarray(ev.gti, dtype=np.float64), gti):
+            return None
+
+    segment_size = gti[0, 1] - gti[0, 0]
+    n_bin = int(np.rint(segment_size / dt))
+    if n_bin < 2:
+        return None
+    return gti, segment_size / n_bin, n_bin
+
+
+def batch_powerspectra(event_lists, dt, norm):
+    """
+    Compute the power spectra of several event lists, binning all of them onto
+    their shared time grid in one parallel pass.
+
+    Each row of counts is turned into a `Lightcurve` and passed to
+    `Powerspectrum.from_lightcurve`, so the spectra are built by stingray itself
+    and carry the same attributes as those from `Powerspectrum.from_events`.
+
+    Args:
+        event_lists (list): The EventLists, which must all have the same single GTI.
+        dt (float): The requested bin width.
+        norm (str): The normalization, as accepted by `Powerspectrum.from_events`.
+
+    Returns:
+        list or None: One `Powerspectrum` per event list, or None if numba is not
+        installed or the event lists cannot be batched, in which case they should go
+        through `Powerspectrum.from_events` one by one.
+
+    Example:
+        >>> spectra = batch_powerspectra([events_a, events_b], dt=1.0, norm="leahy")
+        >>> if spectra is None:
+        ...     spectra = [Powerspectrum.from_events(ev, dt=1.0, norm="leahy") for ev in (events_a, events_b)]
+    """
+    if not HAS_NUMBA:
+        return None
+    grid = batch_time_grid(event_lists, dt)
+    if grid is None:
+        return None
+    gti, dt, n_bin = grid
+    tstart, tstop = gti[0]
+
+    times = np.concatenate([np.asarray(ev.time, dtype=np.float64) for ev in event_lists])
+    offsets = np.cumsum([0] + [len(ev.time) for ev in event_lists])
+    counts = bin_events_batch(times, offsets, tstart, n_bin / (tstop - tstart), n_bin)
+
+    bin_centers = tstart + (np.arange(n_bin) + 0.5) * dt
+    return [
+        Powerspectrum.from_lightcurve(
+            Lightcurve(
+                bin_centers,
+                row_counts,
+                dt=dt,
+                gti=gti,
+                mjdref=ev.mjdref,
+                skip_checks=True,
+            ),
+            norm=norm,
+        )
+        for ev, row_counts in zip(event_lists, counts)
+    ]